@@ -3,19 +3,17 @@
 
 import sys
 import os
-import argparse
 from pathlib import Path
 
 # Add src directory to Python path
 src_path = Path(__file__).parent / "src"
 sys.path.insert(0, str(src_path))
 
-from calbolt_chat_agent.config.settings import settings
-
 
 def run_streamlit():
     """Run the Streamlit web interface."""
     import subprocess
+    from calbolt_chat_agent.config.settings import settings
     
     streamlit_app = Path(__file__).parent / "streamlit_app.py"
     
@@ -35,14 +33,19 @@ def run_streamlit():
 def run_api():
     """Run the FastAPI REST API server."""
     import uvicorn
+    from calbolt_chat_agent.config.settings import settings
     
     print(f"🚀 Starting FastAPI server on http://{settings.host}:{settings.port}")
     
+    # Single worker; scale out with more containers rather than --workers
     uvicorn.run(
         "calbolt_chat_agent.api.rest_api:app",
         host=settings.host,
         port=settings.port,
-        reload=settings.debug
+        reload=settings.debug,
+        loop="uvloop" if sys.platform != "win32" else "asyncio",
+        http="httptools",
+        workers=1
     )
 
 
@@ -86,6 +89,8 @@ def run_cli():
 
 def validate_config():
     """Validate configuration and show status."""
+    from calbolt_chat_agent.config.settings import settings
+    
     print("🔍 Checking configuration...")
     
     try:
@@ -135,8 +140,29 @@ def setup_env():
     print("- USER_EMAIL")
 
 
+# Run modes mapped to their handlers
+COMMANDS = {
+    "web": run_streamlit,
+    "api": run_api,
+    "cli": run_cli,
+    "validate": validate_config,
+    "setup": setup_env,
+}
+
+
 def main():
     """Main entry point."""
+    from calbolt_chat_agent.config.settings import configure_logging
+    
+    configure_logging()
+    
+    # Fast path: a bare mode needs no argument parsing
+    if len(sys.argv) == 2 and sys.argv[1] in COMMANDS:
+        COMMANDS[sys.argv[1]]()
+        return
+    
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description="CalBolt Chat Agent - AI-powered calendar assistant",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -152,42 +178,36 @@ Examples:
     
     parser.add_argument(
         "mode",
-        choices=["web", "api", "cli", "validate", "setup"],
+        choices=list(COMMANDS),
         help="Run mode"
     )
     
     parser.add_argument(
         "--host",
-        default=settings.host,
-        help=f"Host address (default: {settings.host})"
+        default=None,
+        help="Host address (default: HOST setting, 0.0.0.0)"
     )
     
     parser.add_argument(
         "--port",
         type=int,
-        default=settings.port,
-        help=f"Port number (default: {settings.port})"
+        default=None,
+        help="Port number (default: PORT setting, 8000)"
     )
     
     args = parser.parse_args()
     
-    # Update settings with command line args
-    if args.host != settings.host:
-        settings.host = args.host
-    if args.port != settings.port:
-        settings.port = args.port
+    # Update settings with command line args; only the server modes load them
+    if args.mode in ("web", "api") and (args.host is not None or args.port is not None):
+        from calbolt_chat_agent.config.settings import settings
+        
+        if args.host is not None:
+            settings.host = args.host
+        if args.port is not None:
+            settings.port = args.port
     
     # Route to appropriate function
-    if args.mode == "web":
-        run_streamlit()
-    elif args.mode == "api":
-        run_api()
-    elif args.mode == "cli":
-        run_cli()
-    elif args.mode == "validate":
-        validate_config()
-    elif args.mode == "setup":
-        setup_env()
+    COMMANDS[args.mode]()
 
 
 if __name__ == "__main__":
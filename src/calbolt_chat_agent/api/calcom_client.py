@@ -1,13 +1,56 @@
 """Cal.com API client for calendar operations."""
 
-import json
-from datetime import datetime
-from typing import Dict, List, Optional, Any
+import asyncio
+import functools
+import logging
+import threading
+import time
+from collections import OrderedDict
+from operator import attrgetter
+from typing import Callable, Dict, List, Optional, Any, Tuple
+import httpx
+import orjson
 import requests
 from pydantic import BaseModel
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from ..config.settings import settings
 
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "AvailableSlot",
+    "Booking",
+    "BookingRequest",
+    "CalcomAPIError",
+    "CalcomClient",
+    "get_client",
+]
+
+
+# Availability cache windows (seconds): entries younger than the fresh TTL are
+# served as-is, older ones up to the stale TTL are served while refreshing.
+SLOTS_FRESH_TTL = 30.0
+SLOTS_STALE_TTL = 300.0
+SLOTS_CACHE_MAX = 256
+
+# Single-booking cache: bounded LRU, with a shorter lifetime for misses
+BOOKING_CACHE_MAX = 256
+BOOKING_CACHE_TTL = 30.0
+BOOKING_NEGATIVE_TTL = 5.0
+
+# Bookings list cache, so list-then-cancel doesn't fetch the list twice
+BOOKINGS_LIST_TTL = 20.0
+
+# cal-api-version values required by specific endpoints
+BOOKINGS_API_VERSION = "2024-08-13"
+SLOTS_API_VERSION = "2024-09-04"
+
+# Frequently used endpoints
+_URL_SLOTS = "/slots"
+_URL_BOOKINGS = "/bookings"
+
 
 class BookingRequest(BaseModel):
     """Model for booking request data matching Cal.com v2 API."""
@@ -42,6 +85,14 @@ class Booking(BaseModel):
     attendees: List[Dict[str, Any]]
     status: str
     eventType: Dict[str, Any]
+    
+    @functools.cached_property
+    def attendees_display(self) -> str:
+        """Attendees formatted as "Name (email), ...", computed once per booking."""
+        return ", ".join(
+            f"{att.get('name', 'Unknown')} ({att.get('email', 'No email')})"
+            for att in self.attendees
+        )
 
 
 
@@ -59,6 +110,34 @@ class CalcomAPIError(Exception):
     pass
 
 
+def _swallow(default: Any) -> Callable:
+    """Make a client method log failures and return a default instead of raising.
+    
+    Args:
+        default: Value returned on failure, or a callable producing a fresh one
+    """
+    def decorator(func: Callable) -> Callable:
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(self, *args, **kwargs):
+                try:
+                    return await func(self, *args, **kwargs)
+                except Exception as e:
+                    logger.debug("%s failed: %s", func.__name__, e)
+                    return default() if callable(default) else default
+            return async_wrapper
+        
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            try:
+                return func(self, *args, **kwargs)
+            except Exception as e:
+                logger.debug("%s failed: %s", func.__name__, e)
+                return default() if callable(default) else default
+        return wrapper
+    return decorator
+
+
 class CalcomClient:
     """Client for interacting with Cal.com API."""
     
@@ -71,16 +150,94 @@ class CalcomClient:
         """
         self.api_key = api_key or settings.calcom_api_key
         self.base_url = base_url or settings.calcom_base_url
+        self._base = self.base_url.rstrip('/')
         
         if not self.api_key:
             raise ValueError("Cal.com API key is required")
         
-        self.session = requests.Session()
-        self.session.headers.update({
+        # Snapshot settings read on every request
+        self._api_version = settings.calcom_api_version
+        
+        self.headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json",
-            "cal-api-version": settings.calcom_api_version
-        })
+            "cal-api-version": self._api_version
+        }
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        
+        # Pool sized for concurrent API workers; transient upstream errors are
+        # retried here rather than surfacing to the agent. Only idempotent GETs
+        # are retried on gateway errors, since a 502-504 may arrive after a
+        # booking write has already been applied
+        adapter = HTTPAdapter(
+            pool_connections=20,
+            pool_maxsize=100,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 502, 503, 504],
+                allowed_methods=frozenset(["GET"])
+            )
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        
+        # Per-endpoint API version overrides, merged with the client headers;
+        # None keeps the configured default version
+        self._headers_map: Dict[Optional[str], Optional[Dict[str, str]]] = {
+            None: None,
+            BOOKINGS_API_VERSION: {"cal-api-version": BOOKINGS_API_VERSION},
+            SLOTS_API_VERSION: {"cal-api-version": SLOTS_API_VERSION},
+        }
+        
+        # Open a connection in the background so the first real call skips
+        # DNS resolution and the TLS handshake
+        if settings.enable_warmup:
+            threading.Thread(target=self._warmup, daemon=True).start()
+        
+        # Async HTTP/2 client, created on first use by the async API
+        self._async_client: Optional[httpx.AsyncClient] = None
+        
+        # Availability cache keyed by (event_type_id, start_date, end_date)
+        self._slots_cache: Dict[tuple, Tuple[float, List[AvailableSlot]]] = {}
+        self._inflight: Dict[tuple, asyncio.Task] = {}
+        
+        # Booking cache keyed by UID; a None value records a failed lookup
+        self._booking_cache: "OrderedDict[str, Tuple[float, Optional[Booking]]]" = OrderedDict()
+        
+        # Guards slot and booking cache eviction, since the shared client is
+        # used from worker threads
+        self._cache_lock = threading.Lock()
+        
+        # Bookings list cache keyed by page size; cleared by any write
+        self._bookings_cache: Dict[int, Tuple[float, List[Booking]]] = {}
+    
+    @property
+    def async_client(self) -> httpx.AsyncClient:
+        """Shared HTTP/2 client with a pooled connection for the async API."""
+        if self._async_client is None:
+            self._async_client = httpx.AsyncClient(
+                base_url=self.base_url,
+                http2=True,
+                headers=self.headers,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+                timeout=10.0
+            )
+        return self._async_client
+    
+    def _warmup(self) -> None:
+        """Issue a cheap request to establish a pooled keep-alive connection."""
+        try:
+            self.session.get(self._base + "/event-types", params={"take": 1}, timeout=5)
+        except Exception as e:
+            logger.debug("Connection warmup failed: %s", e)
+    
+    async def aclose(self) -> None:
+        """Close the async HTTP client and release its pooled connections."""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
     
     def _make_request(self, method: str, endpoint: str, **kwargs) -> Dict[str, Any]:
         """Make a request to the Cal.com API.
@@ -96,15 +253,11 @@ class CalcomClient:
         Raises:
             CalcomAPIError: If the API request fails
         """
-        url = f"{self.base_url.rstrip('/')}/{endpoint.lstrip('/')}"
-        
-        # Merge headers (allow override from kwargs)
-        headers = kwargs.pop('headers', {})
-        if 'cal-api-version' not in headers:
-            headers['cal-api-version'] = settings.calcom_api_version
-        kwargs['headers'] = headers
+        url = self._base + endpoint if endpoint.startswith('/') else self._base + '/' + endpoint
         
         try:
+            # Session headers carry the default cal-api-version; callers pass
+            # a precomputed override dict which requests merges natively
             response = self.session.request(method, url, **kwargs)
             response.raise_for_status()
             
@@ -112,18 +265,218 @@ class CalcomClient:
             if not response.content:
                 return {}
                 
-            return response.json()
+            return orjson.loads(response.content)
             
         except requests.exceptions.RequestException as e:
             raise CalcomAPIError(f"API request failed: {str(e)}")
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             raise CalcomAPIError(f"Failed to parse API response: {str(e)}")
     
-
+    async def _amake_request(self, method: str, endpoint: str, **kwargs) -> Dict[str, Any]:
+        """Async counterpart of `_make_request` using the shared HTTP/2 client.
+        
+        Args:
+            method: HTTP method (GET, POST)
+            endpoint: API endpoint
+            **kwargs: Additional arguments to pass to httpx
+            
+        Returns:
+            API response data
+            
+        Raises:
+            CalcomAPIError: If the API request fails
+        """
+        try:
+            # Client headers carry the default cal-api-version; callers pass
+            # a precomputed override dict which httpx merges natively
+            response = await self.async_client.request(method, endpoint, **kwargs)
+            response.raise_for_status()
+            
+            # Handle empty responses
+            if not response.content:
+                return {}
+                
+            return orjson.loads(response.content)
+            
+        except httpx.HTTPError as e:
+            raise CalcomAPIError(f"API request failed: {str(e)}")
+        except orjson.JSONDecodeError as e:
+            raise CalcomAPIError(f"Failed to parse API response: {str(e)}")
+    
+    def _get(self, endpoint: str, version: Optional[str] = None, **kwargs) -> Dict[str, Any]:
+        """GET an endpoint, optionally pinned to a specific cal-api-version."""
+        return self._make_request("GET", endpoint, headers=self._headers_map[version], **kwargs)
+    
+    def _post(self, endpoint: str, version: Optional[str] = None, **kwargs) -> Dict[str, Any]:
+        """POST to an endpoint, optionally pinned to a specific cal-api-version."""
+        return self._make_request("POST", endpoint, headers=self._headers_map[version], **kwargs)
+    
+    async def _aget(self, endpoint: str, version: Optional[str] = None, **kwargs) -> Dict[str, Any]:
+        """Async version of `_get`."""
+        return await self._amake_request("GET", endpoint, headers=self._headers_map[version], **kwargs)
+    
+    async def _apost(self, endpoint: str, version: Optional[str] = None, **kwargs) -> Dict[str, Any]:
+        """Async version of `_post`."""
+        return await self._amake_request("POST", endpoint, headers=self._headers_map[version], **kwargs)
+    
+    def _parse_slots(self, response: Dict[str, Any]) -> List[AvailableSlot]:
+        """Parse a v2 slots response into a flat list of available slots."""
+        data = response.get("data", {})
+        if not isinstance(data, dict):
+            return []
+        
+        # Parse the response format: {"2025-08-26": [{"start": "..."}, ...]}
+        construct = AvailableSlot.model_construct
+        return [
+            construct(time=start, attendees=1)
+            for slot_list in data.values() if isinstance(slot_list, list)
+            for slot in slot_list
+            if (start := slot.get("start")) is not None
+        ]
+    
+    def _cached_slots(self, key: tuple) -> Tuple[Optional[List[AvailableSlot]], bool]:
+        """Look up cached slots for a key.
+        
+        Returns:
+            Tuple of (slots, is_fresh); slots is None when missing or expired
+        """
+        entry = self._slots_cache.get(key)
+        if entry is None:
+            return None, False
+        
+        age = time.monotonic() - entry[0]
+        if age < SLOTS_FRESH_TTL:
+            return entry[1], True
+        if age < SLOTS_STALE_TTL:
+            return entry[1], False
+        return None, False
+    
+    def _fetch_slots(self, key: tuple) -> List[AvailableSlot]:
+        """Fetch slots from the API and store them in the cache."""
+        event_type_id, start_date, end_date = key
+        params = {
+            "eventTypeId": event_type_id,
+            "start": start_date,
+            "end": end_date
+        }
+        response = self._get(
+            _URL_SLOTS,
+            SLOTS_API_VERSION,
+            params=params
+        )
+        return self._store_slots(key, self._parse_slots(response))
+    
+    async def _afetch_slots(self, key: tuple) -> List[AvailableSlot]:
+        """Async version of `_fetch_slots`."""
+        event_type_id, start_date, end_date = key
+        params = {
+            "eventTypeId": event_type_id,
+            "start": start_date,
+            "end": end_date
+        }
+        response = await self._aget(
+            _URL_SLOTS,
+            SLOTS_API_VERSION,
+            params=params
+        )
+        return self._store_slots(key, self._parse_slots(response))
+    
+    def _store_slots(self, key: tuple, slots: List[AvailableSlot]) -> List[AvailableSlot]:
+        """Cache slots for a key, dropping the oldest entry beyond SLOTS_CACHE_MAX."""
+        with self._cache_lock:
+            # Re-insert so dict order tracks when each entry was last stored
+            self._slots_cache.pop(key, None)
+            self._slots_cache[key] = (time.monotonic(), slots)
+            if len(self._slots_cache) > SLOTS_CACHE_MAX:
+                del self._slots_cache[next(iter(self._slots_cache))]
+        return slots
+    
+    async def _refresh_slots(self, key: tuple) -> None:
+        """Refresh a stale cache entry in the background, keeping it on failure."""
+        try:
+            await self._afetch_slots(key)
+        except Exception as e:
+            logger.debug("Error refreshing available slots: %s", e)
+        finally:
+            self._inflight.pop(key, None)
+    
+    def _cached_bookings(self, take: int) -> Optional[List[Booking]]:
+        """Return a copy of the cached bookings list, or None if missing or expired."""
+        entry = self._bookings_cache.get(take)
+        if entry is None or time.monotonic() - entry[0] >= BOOKINGS_LIST_TTL:
+            return None
+        return list(entry[1])
+    
+    def _store_bookings(self, take: int, bookings: List[Booking]) -> List[Booking]:
+        """Sort a bookings list by start time, cache it and return a copy for the caller."""
+        # ISO 8601 start times sort chronologically as strings
+        bookings.sort(key=attrgetter("startTime"))
+        self._bookings_cache[take] = (time.monotonic(), bookings)
+        return list(bookings)
+    
+    def _cached_booking(self, booking_uid: str) -> Tuple[bool, Optional[Booking]]:
+        """Look up a booking in the cache.
+        
+        Returns:
+            Tuple of (hit, booking); booking is None for a cached miss
+        """
+        with self._cache_lock:
+            entry = self._booking_cache.get(booking_uid)
+            if entry is None:
+                return False, None
+            
+            stored_at, booking = entry
+            ttl = BOOKING_CACHE_TTL if booking is not None else BOOKING_NEGATIVE_TTL
+            if time.monotonic() - stored_at >= ttl:
+                del self._booking_cache[booking_uid]
+                return False, None
+            
+            self._booking_cache.move_to_end(booking_uid)
+            return True, booking
+    
+    def _store_booking(self, booking_uid: str, booking: Optional[Booking]) -> None:
+        """Cache a booking lookup result, evicting the least recently used entry."""
+        with self._cache_lock:
+            self._booking_cache[booking_uid] = (time.monotonic(), booking)
+            self._booking_cache.move_to_end(booking_uid)
+            if len(self._booking_cache) > BOOKING_CACHE_MAX:
+                self._booking_cache.popitem(last=False)
+    
+    def _invalidate(self, booking_uid: Optional[str]) -> None:
+        """Drop cached availability and bookings after a write, plus the written booking."""
+        with self._cache_lock:
+            self._slots_cache.clear()
+            self._bookings_cache.clear()
+            self._booking_cache.pop(booking_uid, None)
+    
+    def _booking_from_request(self, booking_request: BookingRequest) -> Booking:
+        """Build a booking from the request when the API returns no booking data."""
+        return Booking(
+            id=0,
+            title=booking_request.title or "Meeting",
+            description=booking_request.description,
+            startTime=booking_request.start,
+            endTime=booking_request.end or booking_request.start,
+            attendees=[booking_request.attendee],
+            status="confirmed",
+            eventType={"id": booking_request.eventTypeId}
+        )
+    
+    @staticmethod
+    def _cancel_payload(cancellation_reason: Optional[str], cancel_subsequent_bookings: bool) -> Dict[str, Any]:
+        """Build the request body for a cancellation."""
+        data = {}
+        if cancellation_reason:
+            data["cancellationReason"] = cancellation_reason
+        if cancel_subsequent_bookings:
+            data["cancelSubsequentBookings"] = cancel_subsequent_bookings
+        return data
     
     def get_available_slots(self, event_type_id: int, start_date: str, end_date: str) -> List[AvailableSlot]:
         """Get available time slots using the slots API.
         
+        Results are cached briefly; a stale entry is served if Cal.com fails.
+        
         Args:
             event_type_id: Event type ID
             start_date: Start date in YYYY-MM-DD format
@@ -132,34 +485,31 @@ class CalcomClient:
         Returns:
             List of available slots
         """
+        key = (event_type_id, start_date, end_date)
+        cached, fresh = self._cached_slots(key)
+        if fresh:
+            return cached
+        
         try:
-            params = {
-                "eventTypeId": event_type_id,
-                "start": start_date,
-                "end": end_date
-            }
-            response = self._make_request(
-                "GET",
-                "/slots",
-                params=params,
-                headers={"cal-api-version": "2024-09-04"}
-            )
-            data = response.get("data", {})
-            slots: List[AvailableSlot] = []
-            
-            # Parse the response format: {"2025-08-26": [{"start": "..."}, ...]}
-            if isinstance(data, dict):
-                for date, slot_list in data.items():
-                    if isinstance(slot_list, list):
-                        for slot in slot_list:
-                            if isinstance(slot, dict) and "start" in slot:
-                                slots.append(AvailableSlot(time=slot["start"], attendees=1))
-            
-            return slots
+            return self._fetch_slots(key)
         except Exception as e:
-            if settings.debug:
-                print(f"Error getting available slots: {e}")
-            return []
+            logger.debug("Error getting available slots: %s", e)
+            # Fall back to the stale entry while Cal.com is unreachable
+            return cached if cached is not None else []
+    
+    def get_cached_available_slots(self, event_type_id: int, start_date: str, end_date: str) -> Optional[List[AvailableSlot]]:
+        """Return slots fetched moments ago for exactly this range, without a request.
+        
+        Args:
+            event_type_id: Event type ID
+            start_date: Start date in YYYY-MM-DD format
+            end_date: End date in YYYY-MM-DD format
+            
+        Returns:
+            Fresh cached slots, or None if the range isn't cached or has gone stale
+        """
+        cached, fresh = self._cached_slots((event_type_id, start_date, end_date))
+        return cached if fresh else None
     
     def create_booking(self, booking_request: BookingRequest) -> Booking:
         """Create a new booking.
@@ -171,61 +521,55 @@ class CalcomClient:
             Created booking
         """
         try:
-            # Build payload by excluding None values
-            payload = {k: v for k, v in booking_request.model_dump().items() if v is not None}
-            print(f"payload for create booking: {payload}")
-            response = self._make_request(
-                "POST", 
-                "/bookings", 
-                json=payload,
-                headers={"cal-api-version": "2024-08-13"}
+            # Serialize straight to JSON, excluding None values
+            body = booking_request.model_dump_json(exclude_none=True).encode()
+            logger.debug("payload for create booking: %s", body)
+            response = self._post(
+                _URL_BOOKINGS,
+                BOOKINGS_API_VERSION,
+                data=body
             )
-            print(f"response for create booking: {response}")
+            logger.debug("response for create booking: %s", response)
             booking_data = response.get("data", {})
+            self._invalidate(booking_data.get("uid") if booking_data else None)
             if booking_data:
                 return self._map_booking_v2_to_model(booking_data)
             
             # Fallback response structure
-            return Booking(
-                id=0,
-                title=booking_request.title or "Meeting",
-                description=booking_request.description,
-                startTime=booking_request.start,
-                endTime=booking_request.end or booking_request.start,
-                attendees=[booking_request.attendee],
-                status="confirmed",
-                eventType={"id": booking_request.eventTypeId}
-            )
+            return self._booking_from_request(booking_request)
         except Exception as e:
-            if settings.debug:
-                print(f"Error creating booking: {e}")
+            logger.debug("Error creating booking: %s", e)
             raise CalcomAPIError(f"Failed to create booking: {str(e)}")
     
+    @_swallow(list)
     def get_bookings(self, take: int = 100) -> List[Booking]:
         """Get all bookings.
         
+        Results are cached briefly; creating, cancelling or rescheduling a
+        booking clears the cache.
+        
         Args:
             take: Number of bookings to retrieve (default: 100)
             
         Returns:
-            List of bookings
+            List of bookings, sorted by start time
         """
-        try:
-            params = {"take": take}
-            response = self._make_request(
-                "GET", 
-                "/bookings", 
-                params=params,
-                headers={"cal-api-version": "2024-08-13"}
-            )
-            bookings_data = response.get("data", [])
-            
-            return [self._map_booking_v2_to_model(booking) for booking in bookings_data]
-        except Exception as e:
-            if settings.debug:
-                print(f"Error getting bookings: {e}")
-            return []
+        cached = self._cached_bookings(take)
+        if cached is not None:
+            return cached
+        
+        params = {"take": take}
+        response = self._get(
+            _URL_BOOKINGS,
+            BOOKINGS_API_VERSION,
+            params=params
+        )
+        bookings_data = response.get("data", [])
+        
+        map_booking = self._map_booking_v2_to_model
+        return self._store_bookings(take, [map_booking(booking) for booking in bookings_data])
     
+    @_swallow(False)
     def cancel_booking(self, booking_uid: str, cancellation_reason: Optional[str] = None, cancel_subsequent_bookings: bool = False) -> bool:
         """Cancel a booking.
         
@@ -237,25 +581,16 @@ class CalcomClient:
         Returns:
             True if cancellation was successful, False otherwise
         """
-        try:
-            data = {}
-            if cancellation_reason:
-                data["cancellationReason"] = cancellation_reason
-            if cancel_subsequent_bookings:
-                data["cancelSubsequentBookings"] = cancel_subsequent_bookings
-                
-            response = self._make_request(
-                "POST", 
-                f"/bookings/{booking_uid}/cancel",
-                json=data
-            )
-            
-            return response.get("status") == "success" or response.get("success", True)
-        except Exception as e:
-            if settings.debug:
-                print(f"Error canceling booking: {e}")
-            return False
+        data = self._cancel_payload(cancellation_reason, cancel_subsequent_bookings)
+        response = self._post(
+            f"{_URL_BOOKINGS}/{booking_uid}/cancel",
+            json=data
+        )
+        self._invalidate(booking_uid)
+        
+        return response.get("status") == "success" or response.get("success", True)
     
+    @_swallow(None)
     def reschedule_booking(self, booking_uid: str, new_start: str) -> Optional[Booking]:
         """Reschedule a booking using booking UID.
         
@@ -266,27 +601,25 @@ class CalcomClient:
         Returns:
             Updated booking or None
         """
-        try:
-            body = {"start": new_start}
-                
-            response = self._make_request(
-                "POST", 
-                f"/bookings/{booking_uid}/reschedule",
-                json=body,
-                headers={"cal-api-version": "2024-08-13"}
-            )
-            booking_data = response.get("data", {})
-            if not booking_data:
-                return None
-            return self._map_booking_v2_to_model(booking_data)
-        except Exception as e:
-            if settings.debug:
-                print(f"Error rescheduling booking {booking_uid}: {e}")
+        body = {"start": new_start}
+        
+        response = self._post(
+            f"{_URL_BOOKINGS}/{booking_uid}/reschedule",
+            BOOKINGS_API_VERSION,
+            json=body
+        )
+        self._invalidate(booking_uid)
+        booking_data = response.get("data", {})
+        if not booking_data:
             return None
+        return self._map_booking_v2_to_model(booking_data)
 
     def _map_booking_v2_to_model(self, booking: Dict[str, Any]) -> Booking:
-        """Map v2 booking response (with start/end) to internal Booking model (startTime/endTime)."""
-        return Booking(
+        """Map v2 booking response (with start/end) to internal Booking model (startTime/endTime).
+        
+        API responses are trusted, so the model is built without validation.
+        """
+        return Booking.model_construct(
             id=booking.get("id", 0),
             uid=booking.get("uid"),
             title=booking.get("title", ""),
@@ -303,19 +636,194 @@ class CalcomClient:
     def get_booking(self, booking_uid: str) -> Optional[Booking]:
         """Get a specific booking by its UID.
 
+        Results, including misses, are cached briefly per UID.
+
         Args:
             booking_uid: The Cal.com booking UID
 
         Returns:
             Booking model if found, else None
         """
+        hit, booking = self._cached_booking(booking_uid)
+        if hit:
+            return booking
+        
         try:
-            response = self._make_request("GET", f"/bookings/{booking_uid}")
+            response = self._get(f"{_URL_BOOKINGS}/{booking_uid}")
             booking_data = response.get("data", {})
-            if not booking_data:
-                return None
-            return self._map_booking_v2_to_model(booking_data)
+            booking = self._map_booking_v2_to_model(booking_data) if booking_data else None
         except Exception as e:
-            if settings.debug:
-                print(f"Error getting booking {booking_uid}: {e}")
+            logger.debug("Error getting booking %s: %s", booking_uid, e)
+            booking = None
+        
+        self._store_booking(booking_uid, booking)
+        return booking
+
+    async def aget_available_slots(self, event_type_id: int, start_date: str, end_date: str) -> List[AvailableSlot]:
+        """Async version of `get_available_slots`.
+        
+        Stale cache entries are returned immediately while a background task
+        refreshes them.
+        
+        Args:
+            event_type_id: Event type ID
+            start_date: Start date in YYYY-MM-DD format
+            end_date: End date in YYYY-MM-DD format
+            
+        Returns:
+            List of available slots
+        """
+        key = (event_type_id, start_date, end_date)
+        cached, fresh = self._cached_slots(key)
+        if fresh:
+            return cached
+        
+        if cached is not None:
+            if key not in self._inflight:
+                self._inflight[key] = asyncio.create_task(self._refresh_slots(key))
+            return cached
+        
+        try:
+            return await self._afetch_slots(key)
+        except Exception as e:
+            logger.debug("Error getting available slots: %s", e)
+            return []
+
+    async def acreate_booking(self, booking_request: BookingRequest) -> Booking:
+        """Async version of `create_booking`.
+        
+        Args:
+            booking_request: Booking request data
+            
+        Returns:
+            Created booking
+        """
+        try:
+            # Serialize straight to JSON, excluding None values
+            body = booking_request.model_dump_json(exclude_none=True).encode()
+            response = await self._apost(
+                _URL_BOOKINGS,
+                BOOKINGS_API_VERSION,
+                content=body
+            )
+            booking_data = response.get("data", {})
+            self._invalidate(booking_data.get("uid") if booking_data else None)
+            if booking_data:
+                return self._map_booking_v2_to_model(booking_data)
+            
+            # Fallback response structure
+            return self._booking_from_request(booking_request)
+        except Exception as e:
+            logger.debug("Error creating booking: %s", e)
+            raise CalcomAPIError(f"Failed to create booking: {str(e)}")
+
+    @_swallow(list)
+    async def aget_bookings(self, take: int = 100) -> List[Booking]:
+        """Async version of `get_bookings`.
+        
+        Args:
+            take: Number of bookings to retrieve (default: 100)
+            
+        Returns:
+            List of bookings, sorted by start time
+        """
+        cached = self._cached_bookings(take)
+        if cached is not None:
+            return cached
+        
+        params = {"take": take}
+        response = await self._aget(
+            _URL_BOOKINGS,
+            BOOKINGS_API_VERSION,
+            params=params
+        )
+        bookings_data = response.get("data", [])
+        
+        map_booking = self._map_booking_v2_to_model
+        return self._store_bookings(take, [map_booking(booking) for booking in bookings_data])
+
+    @_swallow(False)
+    async def acancel_booking(self, booking_uid: str, cancellation_reason: Optional[str] = None, cancel_subsequent_bookings: bool = False) -> bool:
+        """Async version of `cancel_booking`.
+        
+        Args:
+            booking_uid: UID of the booking to cancel
+            cancellation_reason: Optional cancellation reason
+            cancel_subsequent_bookings: Whether to cancel subsequent bookings
+            
+        Returns:
+            True if cancellation was successful, False otherwise
+        """
+        data = self._cancel_payload(cancellation_reason, cancel_subsequent_bookings)
+        response = await self._apost(
+            f"{_URL_BOOKINGS}/{booking_uid}/cancel",
+            json=data
+        )
+        self._invalidate(booking_uid)
+        
+        return response.get("status") == "success" or response.get("success", True)
+
+    @_swallow(None)
+    async def areschedule_booking(self, booking_uid: str, new_start: str) -> Optional[Booking]:
+        """Async version of `reschedule_booking`.
+        
+        Args:
+            booking_uid: UID of the booking to reschedule
+            new_start: New start time in ISO 8601 UTC format (e.g., 2025-08-26T23:00:00Z)
+            
+        Returns:
+            Updated booking or None
+        """
+        response = await self._apost(
+            f"{_URL_BOOKINGS}/{booking_uid}/reschedule",
+            BOOKINGS_API_VERSION,
+            json={"start": new_start}
+        )
+        self._invalidate(booking_uid)
+        booking_data = response.get("data", {})
+        if not booking_data:
             return None
+        return self._map_booking_v2_to_model(booking_data)
+
+    async def aget_booking(self, booking_uid: str) -> Optional[Booking]:
+        """Async version of `get_booking`.
+
+        Args:
+            booking_uid: The Cal.com booking UID
+
+        Returns:
+            Booking model if found, else None
+        """
+        hit, booking = self._cached_booking(booking_uid)
+        if hit:
+            return booking
+        
+        try:
+            response = await self._aget(f"{_URL_BOOKINGS}/{booking_uid}")
+            booking_data = response.get("data", {})
+            booking = self._map_booking_v2_to_model(booking_data) if booking_data else None
+        except Exception as e:
+            logger.debug("Error getting booking %s: %s", booking_uid, e)
+            booking = None
+        
+        self._store_booking(booking_uid, booking)
+        return booking
+
+
+# Shared client instance, created on first use
+_client_singleton: Optional[CalcomClient] = None
+_client_lock = threading.Lock()
+
+
+def get_client() -> CalcomClient:
+    """Get or create the shared CalcomClient instance.
+    
+    Concurrent first calls (e.g. parallel tool invocations) are serialized so
+    only one client, and one connection pool, is ever created.
+    """
+    global _client_singleton
+    if _client_singleton is None:
+        with _client_lock:
+            if _client_singleton is None:
+                _client_singleton = CalcomClient()
+    return _client_singleton
@@ -1,30 +1,43 @@
 """REST API endpoints for the CalBolt Chat Agent."""
 
-import uuid
+import logging
+import secrets
 from typing import Dict, List, Optional
-from fastapi import FastAPI, HTTPException, Depends
+import anyio
+import orjson
+from fastapi import FastAPI, HTTPException, Depends, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel, Field
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, ConfigDict, Field
 
-from ..core.agent import session_manager, LiveXChatSession
-from ..config.settings import settings
+from ..core.agent import session_manager, LiveXChatSession, get_tool_descriptions
+from ..config.settings import configure_logging, settings
+
+logger = logging.getLogger(__name__)
 
 
 # Request/Response Models
-class ChatMessage(BaseModel):
+class APIModel(BaseModel):
+    """Base for API models: immutable and rejecting unknown fields."""
+    model_config = ConfigDict(
+        frozen=True,
+        extra="forbid"
+    )
+
+
+class ChatMessage(APIModel):
     """Chat message model."""
     message: str = Field(..., description="User message")
     session_id: Optional[str] = Field(None, description="Session ID for conversation continuity")
 
 
-class ChatResponse(BaseModel):
+class ChatResponse(APIModel):
     """Chat response model."""
     response: str = Field(..., description="Agent response")
     session_id: str = Field(..., description="Session ID")
 
 
-class SessionInfo(BaseModel):
+class SessionInfo(APIModel):
     """Session information model."""
     session_id: str = Field(..., description="Session ID")
     created_at: Optional[str] = Field(None, description="Session creation time")
@@ -32,42 +45,48 @@ class SessionInfo(BaseModel):
     message_count: int = Field(..., description="Number of messages in conversation")
 
 
-class HealthResponse(BaseModel):
+class HealthResponse(APIModel):
     """Health check response model."""
     status: str = Field(..., description="Service status")
     version: str = Field(..., description="Service version")
 
 
-class ErrorResponse(BaseModel):
+class ErrorResponse(APIModel):
     """Error response model."""
     error: str = Field(..., description="Error message")
     detail: Optional[str] = Field(None, description="Error details")
 
 
+# Health payload never changes, so serialize it once
+_HEALTH_BYTES = orjson.dumps(HealthResponse(status="healthy", version="1.0.0").model_dump())
+
+
 # Create FastAPI app
 app = FastAPI(
     title="CalBolt Chat Agent API",
     description="AI-powered chatbot for Cal.com calendar management",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse
 )
 
-# Add CORS middleware
+# Add CORS middleware; set CORS_ORIGINS to an explicit allowlist in production
+_cors_origins = [origin.strip() for origin in settings.cors_origins.split(",") if origin.strip()]
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # Configure appropriately for production
+    allow_origins=["*"] if "*" in _cors_origins else _cors_origins,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "DELETE"],
+    allow_headers=["content-type", "authorization"]
 )
 
 
-# Dependency to get or create session
-def get_session(session_id: Optional[str] = None) -> LiveXChatSession:
+# Dependency to get or create session; async so FastAPI doesn't offload it to a thread
+async def get_session(session_id: Optional[str] = None) -> LiveXChatSession:
     """Get or create a chat session."""
     if not session_id:
-        session_id = str(uuid.uuid4())
+        session_id = secrets.token_hex(16)
     
     return session_manager.get_session(session_id)
 
@@ -76,19 +95,13 @@ def get_session(session_id: Optional[str] = None) -> LiveXChatSession:
 @app.get("/", response_model=HealthResponse)
 async def root():
     """Root endpoint - health check."""
-    return HealthResponse(
-        status="healthy",
-        version="1.0.0"
-    )
+    return Response(content=_HEALTH_BYTES, media_type="application/json")
 
 
 @app.get("/health", response_model=HealthResponse)
 async def health_check():
     """Health check endpoint."""
-    return HealthResponse(
-        status="healthy",
-        version="1.0.0"
-    )
+    return Response(content=_HEALTH_BYTES, media_type="application/json")
 
 
 @app.post("/chat", response_model=ChatResponse)
@@ -103,10 +116,10 @@ async def chat(message: ChatMessage):
     """
     try:
         # Get or create session
-        session = get_session(message.session_id)
+        session = await get_session(message.session_id)
         
-        # Process message
-        response = session.send_message(message.message)
+        # Process message off the event loop; the agent makes blocking HTTP calls
+        response = await anyio.to_thread.run_sync(session.send_message, message.message)
         
         return ChatResponse(
             response=response,
@@ -114,13 +127,40 @@ async def chat(message: ChatMessage):
         )
         
     except Exception as e:
-        error_detail = str(e) if settings.debug else "Internal server error"
+        if settings.debug:
+            logger.exception("chat failed")
+            error_detail = str(e)
+        else:
+            error_detail = "Internal server error"
         raise HTTPException(
             status_code=500,
             detail=error_detail
         )
 
 
+@app.post("/chat/stream")
+async def chat_stream(message: ChatMessage):
+    """Send a message to the chat agent and stream the reply as Server-Sent Events.
+    
+    Each event carries a JSON object with a ``delta`` of response text; the
+    final event carries ``done`` and the session ID.
+    
+    Args:
+        message: Chat message with optional session ID
+        
+    Returns:
+        Event stream of response chunks
+    """
+    session = await get_session(message.session_id)
+    
+    async def events():
+        async for delta in session.astream_message(message.message):
+            yield b"data: " + orjson.dumps({"delta": delta}) + b"\n\n"
+        yield b"data: " + orjson.dumps({"done": True, "session_id": session.session_id}) + b"\n\n"
+    
+    return StreamingResponse(events(), media_type="text/event-stream")
+
+
 @app.post("/chat/{session_id}", response_model=ChatResponse)
 async def chat_with_session(session_id: str, message: ChatMessage):
     """Send a message to a specific session.
@@ -133,8 +173,8 @@ async def chat_with_session(session_id: str, message: ChatMessage):
         Agent response
     """
     try:
-        session = get_session(session_id)
-        response = session.send_message(message.message)
+        session = await get_session(session_id)
+        response = await anyio.to_thread.run_sync(session.send_message, message.message)
         
         return ChatResponse(
             response=response,
@@ -142,7 +182,11 @@ async def chat_with_session(session_id: str, message: ChatMessage):
         )
         
     except Exception as e:
-        error_detail = str(e) if settings.debug else "Internal server error"
+        if settings.debug:
+            logger.exception("chat failed")
+            error_detail = str(e)
+        else:
+            error_detail = "Internal server error"
         raise HTTPException(
             status_code=500,
             detail=error_detail
@@ -156,7 +200,7 @@ async def list_sessions():
     Returns:
         List of session IDs
     """
-    return session_manager.list_sessions()
+    return ORJSONResponse(session_manager.list_sessions())
 
 
 @app.get("/sessions/{session_id}", response_model=SessionInfo)
@@ -169,13 +213,13 @@ async def get_session_info(session_id: str):
     Returns:
         Session information
     """
-    if session_id not in session_manager.sessions:
+    session = session_manager.get_if_exists(session_id)
+    if session is None:
         raise HTTPException(
             status_code=404,
             detail="Session not found"
         )
     
-    session = session_manager.sessions[session_id]
     history = session.get_history()
     
     return SessionInfo(
@@ -196,15 +240,16 @@ async def reset_session(session_id: str):
     Returns:
         Success message
     """
-    if session_id not in session_manager.sessions:
+    session = session_manager.get_if_exists(session_id)
+    if session is None:
         raise HTTPException(
             status_code=404,
             detail="Session not found"
         )
     
-    session_manager.sessions[session_id].reset()
+    session.reset()
     
-    return {"message": f"Session {session_id} has been reset"}
+    return ORJSONResponse({"message": f"Session {session_id} has been reset"})
 
 
 @app.delete("/sessions/{session_id}")
@@ -217,13 +262,13 @@ async def delete_session(session_id: str):
     Returns:
         Success message
     """
-    if not session_manager.delete_session(session_id):
+    if session_manager.pop(session_id) is None:
         raise HTTPException(
             status_code=404,
             detail="Session not found"
         )
     
-    return {"message": f"Session {session_id} has been deleted"}
+    return ORJSONResponse({"message": f"Session {session_id} has been deleted"})
 
 
 @app.get("/sessions/{session_id}/history")
@@ -236,13 +281,13 @@ async def get_session_history(session_id: str):
     Returns:
         Conversation history
     """
-    if session_id not in session_manager.sessions:
+    session = session_manager.get_if_exists(session_id)
+    if session is None:
         raise HTTPException(
             status_code=404,
             detail="Session not found"
         )
     
-    session = session_manager.sessions[session_id]
     history = session.get_history()
     
     # Convert messages to serializable format
@@ -254,7 +299,11 @@ async def get_session_history(session_id: str):
             "timestamp": getattr(msg, 'timestamp', None)
         })
     
-    return {"history": formatted_history}
+    # Serialize once and skip FastAPI's jsonable_encoder pass
+    return Response(
+        content=orjson.dumps({"history": formatted_history}, default=str),
+        media_type="application/json"
+    )
 
 
 @app.post("/sessions/cleanup")
@@ -265,7 +314,7 @@ async def cleanup_sessions():
         Number of sessions cleaned up
     """
     cleaned_count = session_manager.cleanup_inactive_sessions()
-    return {"message": f"Cleaned up {cleaned_count} inactive sessions"}
+    return ORJSONResponse({"message": f"Cleaned up {cleaned_count} inactive sessions"})
 
 
 @app.get("/tools")
@@ -275,37 +324,30 @@ async def get_available_tools():
     Returns:
         List of available tools and their descriptions
     """
-    from ..core.agent import LiveXChatAgent
-    
-    try:
-        agent = LiveXChatAgent()
-        tools = agent.get_available_tools()
-        return {"tools": tools}
-    except Exception as e:
-        error_detail = str(e) if settings.debug else "Error retrieving tools"
-        raise HTTPException(
-            status_code=500,
-            detail=error_detail
-        )
+    return ORJSONResponse({"tools": get_tool_descriptions()})
 
 
 # Exception handlers
 @app.exception_handler(ValueError)
 async def value_error_handler(request, exc):
     """Handle ValueError exceptions."""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=400,
-        content=ErrorResponse(error="Invalid input", detail=str(exc)).dict()
+        content=ErrorResponse(error="Invalid input", detail=str(exc)).model_dump()
     )
 
 
 @app.exception_handler(Exception)
 async def general_exception_handler(request, exc):
     """Handle general exceptions."""
-    error_detail = str(exc) if settings.debug else "Internal server error"
-    return JSONResponse(
+    if settings.debug:
+        logger.exception("Unhandled error on %s", request.url.path, exc_info=exc)
+        error_detail = str(exc)
+    else:
+        error_detail = "Internal server error"
+    return ORJSONResponse(
         status_code=500,
-        content=ErrorResponse(error="Server error", detail=error_detail).dict()
+        content=ErrorResponse(error="Server error", detail=error_detail).model_dump()
     )
 
 
@@ -313,6 +355,8 @@ async def general_exception_handler(request, exc):
 @app.on_event("startup")
 async def startup_event():
     """Startup event handler."""
+    configure_logging()
+    
     try:
         # Validate settings
         settings.validate_required_settings()
@@ -328,11 +372,16 @@ async def startup_event():
 
 
 if __name__ == "__main__":
+    import sys
     import uvicorn
     
+    # Sessions live in process memory, so stay on a single worker
     uvicorn.run(
         "calbolt_chat_agent.api.rest_api:app",
         host=settings.host,
         port=settings.port,
-        reload=settings.debug
+        reload=settings.debug,
+        loop="uvloop" if sys.platform != "win32" else "asyncio",
+        http="httptools",
+        workers=1
     )
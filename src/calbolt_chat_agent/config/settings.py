@@ -1,27 +1,27 @@
 """Configuration settings for the CalBolt Chat Agent."""
 
-import os
+import logging
 from typing import Optional
-from dotenv import load_dotenv
 from pydantic import Field
 from pydantic_settings import BaseSettings
 
-# Load environment variables from .env file
-load_dotenv()
-
 
 class Settings(BaseSettings):
-    """Application settings configuration."""
+    """Application settings configuration.
+    
+    Every field is read from the environment variable of the same name
+    (case-insensitive) or from a local .env file.
+    """
     
     # OpenAI Configuration
     openai_api_key: str = Field(
-        default_factory=lambda: os.getenv("OPENAI_API_KEY", ""),
+        default="",
         description="OpenAI API key for GPT function calling"
     )
     
     # Cal.com Configuration
     calcom_api_key: str = Field(
-        default_factory=lambda: os.getenv("CALCOM_API_KEY", ""),
+        default="",
         description="Cal.com API key for calendar operations"
     )
     calcom_base_url: str = Field(
@@ -29,19 +29,23 @@ class Settings(BaseSettings):
         description="Base URL for Cal.com API"
     )
     calcom_api_version: str = Field(
-        default_factory=lambda: os.getenv("CALCOM_API_VERSION", "2024-08-13"),
+        default="2024-08-13",
         description="cal-api-version header value for Cal.com v2 API"
     )
+    enable_warmup: bool = Field(
+        default=True,
+        description="Pre-open a Cal.com connection when the client is created"
+    )
     
     # User Configuration
     user_email: str = Field(
-        default_factory=lambda: os.getenv("USER_EMAIL", ""),
+        default="",
         description="User email for calendar operations"
     )
     
     # Application Configuration
     debug: bool = Field(
-        default_factory=lambda: os.getenv("DEBUG", "False").lower() == "true",
+        default=False,
         description="Debug mode flag"
     )
     host: str = Field(
@@ -52,6 +56,10 @@ class Settings(BaseSettings):
         default=8000,
         description="Port for the web server"
     )
+    cors_origins: str = Field(
+        default="*",
+        description="Comma-separated list of allowed CORS origins, or * for any"
+    )
     
     # Model Configuration
     openai_model: str = Field(
@@ -92,3 +100,15 @@ class Settings(BaseSettings):
 
 # Global settings instance
 settings = Settings()
+
+
+def configure_logging() -> None:
+    """Surface package debug logs on stderr when debug mode is on.
+    
+    Called from the entry points rather than at import, and safe to call
+    again on a Streamlit rerun or server reload.
+    """
+    if settings.debug:
+        # basicConfig is a no-op once the root logger has a handler
+        logging.basicConfig()
+        logging.getLogger("calbolt_chat_agent").setLevel(logging.DEBUG)
@@ -1,17 +1,99 @@
 """Core chatbot agent implementation using LangChain and OpenAI."""
 
-from typing import List, Dict, Any, Optional
+from typing import AsyncIterator, Iterator, List, Dict, Any, Optional, Tuple
 import datetime
+import logging
+import queue
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
 from langchain.agents import AgentExecutor, create_openai_tools_agent
 from langchain.tools import BaseTool
 from langchain_openai import ChatOpenAI
 from langchain.prompts import ChatPromptTemplate, MessagesPlaceholder
 from langchain.schema import BaseMessage
 from langchain.memory import ConversationBufferMemory
+from langchain_core.callbacks import BaseCallbackHandler
 
 from ..config.settings import settings
 from ..tools.calendar_functions import get_calendar_tools
-from ..api.calcom_client import CalcomClient
+from ..api.calcom_client import CalcomClient, get_client
+
+logger = logging.getLogger(__name__)
+
+# The prompt is built once per process; only the current time varies per call
+_SYSTEM_PROMPT = """You are CalBolt Chat Agent, an AI assistant specialized in helping users manage their calendar and meetings through Cal.com integration.
+
+**Your Capabilities:**
+- Book new meetings with specified date, time, and attendee details
+- List all scheduled meetings for the user
+- Cancel existing meetings by ID or description
+- Reschedule meetings to new times
+- Provide helpful scheduling assistance and recommendations
+
+**Your Personality:**
+- Friendly, professional, and helpful
+- Proactive in asking for necessary details
+- Clear in confirmations and updates
+- Efficient in handling calendar operations
+
+**Important Guidelines:**
+1. **Always confirm important details** before booking or making changes
+2. **Ask for missing information** required for calendar operations:
+   - For booking: date, time, duration, title, attendee name and email
+   - For canceling: specific meeting identifier (ID, title, or time)
+   - For rescheduling: specific meeting identifier and new date/time
+3. **Use natural language** to interpret user requests (e.g., "tomorrow at 3pm", "next Monday")
+4. **Provide clear confirmations** with all relevant meeting details
+5. **Handle errors gracefully** and suggest alternatives when possible
+6. **Be proactive** in suggesting available time slots when requested times are unavailable
+
+**User Context:**
+- User email: {user_email}
+- Current date/time: {current_time}
+
+Remember to be conversational and helpful while being efficient with calendar operations. Always double-check important details before making changes to someone's calendar.
+""".replace("{user_email}", settings.user_email)
+
+_PROMPT_TEMPLATE = ChatPromptTemplate.from_messages([
+    ("system", _SYSTEM_PROMPT),
+    MessagesPlaceholder("chat_history"),
+    ("human", "{input}"),
+    MessagesPlaceholder("agent_scratchpad")
+]).partial(current_time=lambda: datetime.datetime.now().isoformat())
+
+_TOOLS: List[BaseTool] = get_calendar_tools()
+
+
+@lru_cache(maxsize=1)
+def get_tool_descriptions() -> List[Dict[str, str]]:
+    """Get name and description of every calendar tool.
+    
+    The tool set is static for the process lifetime, so this is computed once.
+    
+    Returns:
+        List of tool information dictionaries
+    """
+    return [
+        {
+            "name": tool.name,
+            "description": tool.description
+        }
+        for tool in _TOOLS
+    ]
+
+
+class _TokenQueueHandler(BaseCallbackHandler):
+    """Callback handler that forwards streamed model tokens to a queue."""
+    
+    def __init__(self, tokens: "queue.Queue[Optional[str]]"):
+        self.tokens = tokens
+    
+    def on_llm_new_token(self, token: str, **kwargs: Any) -> None:
+        # Tool-call chunks arrive as empty tokens
+        if token:
+            self.tokens.put(token)
 
 
 class LiveXChatAgent:
@@ -26,7 +108,7 @@ class LiveXChatAgent:
         
         Args:
             openai_api_key: OpenAI API key. If not provided, uses settings.
-            calcom_client: Cal.com client instance. If not provided, creates new one.
+            calcom_client: Cal.com client instance. If not provided, uses the shared one.
             model_name: OpenAI model name. If not provided, uses settings.
             temperature: Model temperature. If not provided, uses settings.
         """
@@ -38,7 +120,7 @@ class LiveXChatAgent:
             raise ValueError("OpenAI API key is required")
         
         # Initialize components
-        self.calcom_client = calcom_client or CalcomClient()
+        self.calcom_client = calcom_client or get_client()
         self.llm = self._create_llm()
         self.tools = self._get_tools()
         self.memory = ConversationBufferMemory(
@@ -58,88 +140,149 @@ class LiveXChatAgent:
     
     def _get_tools(self) -> List[BaseTool]:
         """Get all available tools for the agent."""
-        return get_calendar_tools()
-    
-    def _create_system_prompt(self) -> str:
-        """Create the system prompt for the agent."""
-        return """You are CalBolt Chat Agent, an AI assistant specialized in helping users manage their calendar and meetings through Cal.com integration.
-
-**Your Capabilities:**
-- Book new meetings with specified date, time, and attendee details
-- List all scheduled meetings for the user
-- Cancel existing meetings by ID or description
-- Reschedule meetings to new times
-- Provide helpful scheduling assistance and recommendations
-
-**Your Personality:**
-- Friendly, professional, and helpful
-- Proactive in asking for necessary details
-- Clear in confirmations and updates
-- Efficient in handling calendar operations
-
-**Important Guidelines:**
-1. **Always confirm important details** before booking or making changes
-2. **Ask for missing information** required for calendar operations:
-   - For booking: date, time, duration, title, attendee name and email
-   - For canceling: specific meeting identifier (ID, title, or time)
-   - For rescheduling: specific meeting identifier and new date/time
-3. **Use natural language** to interpret user requests (e.g., "tomorrow at 3pm", "next Monday")
-4. **Provide clear confirmations** with all relevant meeting details
-5. **Handle errors gracefully** and suggest alternatives when possible
-6. **Be proactive** in suggesting available time slots when requested times are unavailable
-
-**User Context:**
-- User email: {user_email}
-- Current date/time: {current_time}
-
-Remember to be conversational and helpful while being efficient with calendar operations. Always double-check important details before making changes to someone's calendar.
-""".format(
-            user_email=settings.user_email,
-            current_time=datetime.datetime.now().isoformat()
-        )
+        return list(_TOOLS)
     
     def _create_agent(self) -> AgentExecutor:
         """Create the agent executor."""
-        prompt = ChatPromptTemplate.from_messages([
-            ("system", self._create_system_prompt()),
-            MessagesPlaceholder("chat_history"),
-            ("human", "{input}"),
-            MessagesPlaceholder("agent_scratchpad")
-        ])
-        
         agent = create_openai_tools_agent(
             llm=self.llm,
             tools=self.tools,
-            prompt=prompt
+            prompt=_PROMPT_TEMPLATE
         )
         
         return AgentExecutor(
             agent=agent,
             tools=self.tools,
-            memory=self.memory,
             verbose=settings.debug,
             handle_parsing_errors=True,
             max_iterations=5
         )
     
-    def chat(self, message: str) -> str:
+    def chat(self, message: str, memory: Optional[ConversationBufferMemory] = None) -> str:
         """Process a chat message and return the response.
         
+        The executor holds no memory of its own, so one agent can serve many
+        conversations; the history comes from, and is written back to, the
+        given memory.
+        
         Args:
             message: User message
+            memory: Conversation memory to use. Defaults to the agent's own.
             
         Returns:
             Agent response
         """
+        memory = memory or self.memory
         try:
-            response = self.agent_executor.invoke({"input": message})
-            return response.get("output", "I'm sorry, I couldn't process your request. Please try again.")
+            response = self.agent_executor.invoke({
+                "input": message,
+                "chat_history": memory.chat_memory.messages
+            })
+            output = response.get("output", "I'm sorry, I couldn't process your request. Please try again.")
+            memory.save_context({"input": message}, {"output": output})
+            return output
         except Exception as e:
-            error_msg = f"Error processing your request: {str(e)}"
-            if settings.debug:
-                print(error_msg)
+            logger.debug("Error processing your request: %s", e)
             return "I encountered an error while processing your request. Please try again or contact support."
     
+    async def astream_chat(self,
+                           message: str,
+                           memory: Optional[ConversationBufferMemory] = None) -> AsyncIterator[str]:
+        """Process a chat message and stream the response text as it is generated.
+        
+        The full reply is saved to memory once the run completes.
+        
+        Args:
+            message: User message
+            memory: Conversation memory to use. Defaults to the agent's own.
+            
+        Yields:
+            Chunks of response text
+        """
+        memory = memory or self.memory
+        inputs = {
+            "input": message,
+            "chat_history": memory.chat_memory.messages
+        }
+        chunks: List[str] = []
+        output: Optional[str] = None
+        try:
+            async for event in self.agent_executor.astream_events(inputs, version="v2"):
+                kind = event["event"]
+                if kind == "on_chat_model_stream":
+                    delta = event["data"]["chunk"].content
+                    if delta:
+                        chunks.append(delta)
+                        yield delta
+                elif kind == "on_chain_end" and not event["parent_ids"]:
+                    output = event["data"]["output"].get("output")
+        except Exception as e:
+            logger.debug("Error processing your request: %s", e)
+            yield "I encountered an error while processing your request. Please try again or contact support."
+            return
+        
+        memory.save_context({"input": message}, {"output": output or "".join(chunks)})
+    
+    def stream_chat(self,
+                    message: str,
+                    memory: Optional[ConversationBufferMemory] = None) -> Iterator[str]:
+        """Process a chat message and yield the response text as it is generated.
+        
+        Synchronous counterpart of `astream_chat` for callers without an event
+        loop, such as the Streamlit UI. The agent runs in a worker thread and
+        hands model tokens over through a queue; the full reply is saved to
+        memory once the run completes.
+        
+        Args:
+            message: User message
+            memory: Conversation memory to use. Defaults to the agent's own.
+            
+        Yields:
+            Chunks of response text
+        """
+        memory = memory or self.memory
+        inputs = {
+            "input": message,
+            "chat_history": memory.chat_memory.messages
+        }
+        tokens: "queue.Queue[Optional[str]]" = queue.Queue()
+        result: Dict[str, Any] = {}
+        
+        def run() -> None:
+            try:
+                result["response"] = self.agent_executor.invoke(
+                    inputs,
+                    config={"callbacks": [_TokenQueueHandler(tokens)]}
+                )
+            except Exception as e:
+                result["error"] = e
+            finally:
+                # Sentinel: the run is over
+                tokens.put(None)
+        
+        worker = threading.Thread(target=run, name="calbolt-stream", daemon=True)
+        worker.start()
+        
+        chunks: List[str] = []
+        while True:
+            token = tokens.get()
+            if token is None:
+                break
+            chunks.append(token)
+            yield token
+        worker.join()
+        
+        if "error" in result:
+            logger.debug("Error processing your request: %s", result["error"])
+            yield "I encountered an error while processing your request. Please try again or contact support."
+            return
+        
+        output = result["response"].get("output") or "".join(chunks)
+        if not chunks:
+            # The model didn't stream; hand over the reply in one piece
+            yield output
+        memory.save_context({"input": message}, {"output": output})
+    
     def reset_conversation(self) -> None:
         """Reset the conversation memory."""
         self.memory.clear()
@@ -167,8 +310,23 @@ Remember to be conversational and helpful while being efficient with calendar op
         ]
 
 
+# Agent shared by all sessions, created on first use
+_shared_agent: Optional[LiveXChatAgent] = None
+_shared_agent_lock = threading.Lock()
+
+
+def get_shared_agent() -> LiveXChatAgent:
+    """Get or create the LiveXChatAgent shared by all chat sessions."""
+    global _shared_agent
+    if _shared_agent is None:
+        with _shared_agent_lock:
+            if _shared_agent is None:
+                _shared_agent = LiveXChatAgent()
+    return _shared_agent
+
+
 class LiveXChatSession:
-    """Manages a chat session with conversation state."""
+    """Manages a chat session with its own conversation memory."""
     
     def __init__(self, 
                  session_id: str,
@@ -180,10 +338,21 @@ class LiveXChatSession:
             agent: CalBolt chat agent instance
         """
         self.session_id = session_id
-        self.agent = agent or LiveXChatAgent()
+        self.agent = agent or get_shared_agent()
+        self.memory = ConversationBufferMemory(
+            memory_key="chat_history",
+            return_messages=True
+        )
         self.created_at = None
         self.last_active = None
     
+    def _touch(self) -> None:
+        """Record activity on the session."""
+        now = datetime.datetime.now()
+        if not self.created_at:
+            self.created_at = now
+        self.last_active = now
+    
     def send_message(self, message: str) -> str:
         """Send a message and get response.
         
@@ -193,30 +362,80 @@ class LiveXChatSession:
         Returns:
             Agent response
         """
-        import datetime
-        
-        if not self.created_at:
-            self.created_at = datetime.datetime.now()
-        
-        self.last_active = datetime.datetime.now()
+        self._touch()
+        return self.agent.chat(message, self.memory)
+    
+    async def astream_message(self, message: str) -> AsyncIterator[str]:
+        """Send a message and stream the response.
         
-        return self.agent.chat(message)
+        Args:
+            message: User message
+            
+        Yields:
+            Chunks of response text
+        """
+        self._touch()
+        async for delta in self.agent.astream_chat(message, self.memory):
+            yield delta
     
     def reset(self) -> None:
         """Reset the session conversation."""
-        self.agent.reset_conversation()
+        self.memory.clear()
     
     def get_history(self) -> List[BaseMessage]:
         """Get conversation history."""
-        return self.agent.get_conversation_history()
+        return self.memory.chat_memory.messages
 
 
 class SessionManager:
-    """Manages multiple chat sessions."""
+    """Manages multiple chat sessions.
+    
+    Sessions are spread across a fixed number of shards, each guarded by
+    its own lock, so concurrent requests for unrelated sessions don't
+    contend with each other. Each shard is an LRU bounded to its share of
+    MAX_SESSIONS, and sessions idle for longer than SESSION_TTL seconds
+    are dropped the next time their shard is touched.
+    """
+    
+    SHARD_COUNT = 32
+    MAX_SESSIONS = 10_000
+    SESSION_TTL = 24 * 3600.0
     
     def __init__(self):
         """Initialize session manager."""
-        self.sessions: Dict[str, LiveXChatSession] = {}
+        # Each shard maps session ID -> (session, last access on the monotonic clock)
+        self._shards: List["OrderedDict[str, Tuple[LiveXChatSession, float]]"] = [
+            OrderedDict() for _ in range(self.SHARD_COUNT)
+        ]
+        self._locks = [threading.Lock() for _ in range(self.SHARD_COUNT)]
+        self._shard_max = -(-self.MAX_SESSIONS // self.SHARD_COUNT)
+    
+    def _shard(self, session_id: str) -> int:
+        """Return the shard index for a session ID."""
+        return hash(session_id) & (self.SHARD_COUNT - 1)
+    
+    def _lookup(self, idx: int, session_id: str, now: float) -> Optional[LiveXChatSession]:
+        """Return a live session and refresh its access time. Caller holds the shard lock."""
+        shard = self._shards[idx]
+        entry = shard.get(session_id)
+        if entry is None:
+            return None
+        if now - entry[1] > self.SESSION_TTL:
+            del shard[session_id]
+            return None
+        shard[session_id] = (entry[0], now)
+        shard.move_to_end(session_id)
+        return entry[0]
+    
+    def _evict(self, idx: int, now: float) -> None:
+        """Drop expired and least recently used sessions. Caller holds the shard lock."""
+        shard = self._shards[idx]
+        # Entries are in access order, so expired ones sit at the front
+        while shard:
+            _, (_, touched) = next(iter(shard.items()))
+            if now - touched <= self.SESSION_TTL and len(shard) <= self._shard_max:
+                break
+            shard.popitem(last=False)
     
     def get_session(self, session_id: str) -> LiveXChatSession:
         """Get or create a chat session.
@@ -227,10 +446,49 @@ class SessionManager:
         Returns:
             Chat session instance
         """
-        if session_id not in self.sessions:
-            self.sessions[session_id] = LiveXChatSession(session_id)
+        idx = self._shard(session_id)
+        with self._locks[idx]:
+            session = self._lookup(idx, session_id, time.monotonic())
+        if session is not None:
+            return session
         
-        return self.sessions[session_id]
+        # Build outside the lock; the first session also creates the shared agent
+        session = LiveXChatSession(session_id)
+        with self._locks[idx]:
+            now = time.monotonic()
+            existing = self._lookup(idx, session_id, now)
+            if existing is not None:
+                return existing
+            self._shards[idx][session_id] = (session, now)
+            self._evict(idx, now)
+            return session
+    
+    def get_if_exists(self, session_id: str) -> Optional[LiveXChatSession]:
+        """Get an existing chat session without creating one.
+        
+        Args:
+            session_id: Session identifier
+            
+        Returns:
+            Chat session instance, or None if not found
+        """
+        idx = self._shard(session_id)
+        with self._locks[idx]:
+            return self._lookup(idx, session_id, time.monotonic())
+    
+    def pop(self, session_id: str) -> Optional[LiveXChatSession]:
+        """Remove a chat session and return it.
+        
+        Args:
+            session_id: Session identifier
+            
+        Returns:
+            The removed session, or None if not found
+        """
+        idx = self._shard(session_id)
+        with self._locks[idx]:
+            entry = self._shards[idx].pop(session_id, None)
+        return entry[0] if entry is not None else None
     
     def delete_session(self, session_id: str) -> bool:
         """Delete a chat session.
@@ -241,10 +499,7 @@ class SessionManager:
         Returns:
             True if session was deleted, False if not found
         """
-        if session_id in self.sessions:
-            del self.sessions[session_id]
-            return True
-        return False
+        return self.pop(session_id) is not None
     
     def list_sessions(self) -> List[str]:
         """List all active session IDs.
@@ -252,7 +507,12 @@ class SessionManager:
         Returns:
             List of session IDs
         """
-        return list(self.sessions.keys())
+        cutoff = time.monotonic() - self.SESSION_TTL
+        session_ids: List[str] = []
+        for shard, lock in zip(self._shards, self._locks):
+            with lock:
+                session_ids.extend(sid for sid, (_, touched) in shard.items() if touched >= cutoff)
+        return session_ids
     
     def cleanup_inactive_sessions(self, max_inactive_hours: int = 24) -> int:
         """Clean up inactive sessions.
@@ -263,18 +523,19 @@ class SessionManager:
         Returns:
             Number of sessions cleaned up
         """
-        import datetime
-        
         cutoff_time = datetime.datetime.now() - datetime.timedelta(hours=max_inactive_hours)
-        inactive_sessions = [
-            sid for sid, session in self.sessions.items()
-            if session.last_active and session.last_active < cutoff_time
-        ]
-        
-        for session_id in inactive_sessions:
-            del self.sessions[session_id]
+        cleaned = 0
+        for shard, lock in zip(self._shards, self._locks):
+            with lock:
+                inactive_sessions = [
+                    sid for sid, (session, _) in shard.items()
+                    if session.last_active and session.last_active < cutoff_time
+                ]
+                for session_id in inactive_sessions:
+                    del shard[session_id]
+            cleaned += len(inactive_sessions)
         
-        return len(inactive_sessions)
+        return cleaned
 
 
 # Global session manager instance
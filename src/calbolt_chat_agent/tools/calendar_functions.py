@@ -1,48 +1,111 @@
 """Calendar functions for LangChain tool integration."""
 
+import asyncio
+import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional
+from functools import lru_cache
+from typing import Callable, List, Optional, Tuple
 import pytz
 
-from langchain_core.tools import tool
-from pydantic import BaseModel, Field
+from langchain_core.tools import StructuredTool, tool
+from pydantic import BaseModel, ConfigDict, Field
 
-from ..api.calcom_client import CalcomClient, BookingRequest
-from ..config.settings import settings
+from ..api.calcom_client import AvailableSlot, Booking, CalcomClient, BookingRequest, get_client
 
+# Cal.com event type used for every booking (30-minute meeting); resolved
+# once here instead of looking event types up on each tool call
+EVENT_TYPE_ID = 3161359
 
-# Global client instance
-_calcom_client: Optional[CalcomClient] = None
+# Cal.com booking UIDs are long opaque tokens without spaces
+_UID_PATTERN = re.compile(r"^[A-Za-z0-9_-]{16,}$")
+
+# Small pool for overlapping independent Cal.com calls within a tool
+_io_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="calbolt-tools")
+
+# Timezones used for display and API conversion, resolved once at import;
+# all user-facing dates and times are Pacific
+_LA_TZ_NAME = "America/Los_Angeles"
+_LA_TZ = pytz.timezone(_LA_TZ_NAME)
+_UTC = pytz.UTC
 
 
 def get_calcom_client() -> CalcomClient:
-    """Get or create the global CalcomClient instance."""
-    global _calcom_client
-    if _calcom_client is None:
-        _calcom_client = CalcomClient()
-    return _calcom_client
+    """Get the shared CalcomClient instance."""
+    return get_client()
+
+
+def _parse_iso(value: str) -> datetime:
+    """Parse an ISO-8601 timestamp, accepting a trailing 'Z' for UTC."""
+    if value.endswith('Z'):
+        value = value[:-1] + '+00:00'
+    return datetime.fromisoformat(value)
+
+
+def _parse_local(date_str: str, time_str: str) -> datetime:
+    """Parse a YYYY-MM-DD date and HH:MM time into a naive datetime.
+    
+    Uses the C fromisoformat parser and only falls back to strptime for
+    inputs it rejects, such as single-digit hours.
+    """
+    try:
+        return datetime.fromisoformat(f"{date_str}T{time_str}")
+    except ValueError:
+        return datetime.strptime(f"{date_str} {time_str}", "%Y-%m-%d %H:%M")
+
+
+_MONTHS = (
+    "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December"
+)
+
+
+def _fmt_time(dt: datetime) -> str:
+    """Format a time like strftime('%I:%M %p'), e.g. "03:30 PM"."""
+    return f"{dt.hour % 12 or 12:02d}:{dt.minute:02d} {'PM' if dt.hour >= 12 else 'AM'}"
+
+
+def _fmt_date(dt: datetime) -> str:
+    """Format a date like strftime('%B %d, %Y'), e.g. "August 26, 2025"."""
+    return f"{_MONTHS[dt.month - 1]} {dt.day:02d}, {dt.year}"
+
+
+def _fmt_datetime(dt: datetime) -> str:
+    """Format a date and time like strftime('%B %d, %Y at %I:%M %p')."""
+    return f"{_fmt_date(dt)} at {_fmt_time(dt)}"
+
+
+def _fmt_short_datetime(dt: datetime) -> str:
+    """Format a date and time like strftime('%B %d at %I:%M %p')."""
+    return f"{_MONTHS[dt.month - 1]} {dt.day:02d} at {_fmt_time(dt)}"
 
 
+def _parse_utc(utc_time_str: str) -> datetime:
+    """Parse a Cal.com timestamp into an aware datetime.
+    
+    Timestamps without an offset are UTC.
+    """
+    utc_dt = _parse_iso(utc_time_str)
+    if utc_dt.tzinfo is None:
+        utc_dt = utc_dt.replace(tzinfo=_UTC)
+    return utc_dt
+
+
+@lru_cache(maxsize=4096)
 def convert_utc_to_la(utc_time_str: str) -> datetime:
     """Convert UTC time string to America/Los_Angeles timezone."""
+    return _parse_utc(utc_time_str).astimezone(_LA_TZ)
+
+
+def _try_convert_utc_to_la(utc_time_str: str) -> Optional[datetime]:
+    """Like `convert_utc_to_la`, but return None for unparseable input."""
     try:
-        # Parse UTC time (handle both formats: with and without 'Z')
-        if utc_time_str.endswith('Z'):
-            utc_dt = datetime.fromisoformat(utc_time_str.replace('Z', '+00:00'))
-        else:
-            utc_dt = datetime.fromisoformat(utc_time_str + '+00:00')
-        
-        # Convert to LA timezone
-        la_tz = pytz.timezone('America/Los_Angeles')
-        la_dt = utc_dt.astimezone(la_tz)
-        return la_dt
-    except:
-        # Fallback: treat as UTC and convert
-        utc_dt = datetime.fromisoformat(utc_time_str.replace('Z', '+00:00'))
-        la_tz = pytz.timezone('America/Los_Angeles')
-        return utc_dt.astimezone(la_tz)
+        return convert_utc_to_la(utc_time_str)
+    except (AttributeError, TypeError, ValueError):
+        return None
 
 
+@lru_cache(maxsize=4096)
 def convert_la_to_utc(date_str: str, time_str: str) -> str:
     """Convert LA timezone date/time to UTC ISO format for API calls.
     
@@ -53,19 +116,53 @@ def convert_la_to_utc(date_str: str, time_str: str) -> str:
     Returns:
         UTC time in ISO format (e.g., "2025-08-26T23:00:00Z")
     """
-    # Parse as LA timezone datetime
-    la_tz = pytz.timezone('America/Los_Angeles')
-    naive_datetime = datetime.strptime(f"{date_str} {time_str}", "%Y-%m-%d %H:%M")
-    la_datetime = la_tz.localize(naive_datetime)
+    naive_datetime = _parse_local(date_str, time_str)
     
-    # Convert to UTC
-    utc_datetime = la_datetime.astimezone(pytz.UTC)
+    # Shift by the LA offset in effect at that time (is_dst=False matches
+    # localize's default for ambiguous and non-existent times)
+    utc_datetime = naive_datetime - _LA_TZ.utcoffset(naive_datetime, is_dst=False)
     
     # Return in Cal.com API format
-    return utc_datetime.strftime("%Y-%m-%dT%H:%M:%SZ")
+    return utc_datetime.isoformat(timespec="seconds") + "Z"
+
+
+def _find_booking_by_key(bookings: List[Booking], identifier: str) -> Optional[Booking]:
+    """Find a booking by numeric ID, or by UID for any other identifier."""
+    if identifier.isdigit():
+        booking_id = int(identifier)
+        return next((b for b in bookings if b.id == booking_id), None)
+    return next((b for b in bookings if b.uid == identifier), None)
+
+
+def _looks_like_uid(identifier: str) -> bool:
+    """Check whether an identifier could be a Cal.com booking UID."""
+    return not identifier.isdigit() and _UID_PATTERN.match(identifier) is not None
+
+
+def _get_booking_by_uid(client: CalcomClient, identifier: str) -> Optional[Booking]:
+    """Fetch a booking directly when the identifier looks like a Cal.com UID.
+    
+    Numeric IDs and free-text descriptions return None so the caller falls
+    back to searching the bookings list.
+    """
+    if not _looks_like_uid(identifier):
+        return None
+    return client.get_booking(identifier)
+
+
+async def _aget_booking_by_uid(client: CalcomClient, identifier: str) -> Optional[Booking]:
+    """Async version of `_get_booking_by_uid`."""
+    if not _looks_like_uid(identifier):
+        return None
+    return await client.aget_booking(identifier)
 
 
-class BookMeetingInput(BaseModel):
+class _ToolInput(BaseModel):
+    """Base for tool input schemas; arguments are immutable once validated."""
+    model_config = ConfigDict(frozen=True)
+
+
+class BookMeetingInput(_ToolInput):
     """Input schema for booking a meeting."""
     date: str = Field(description="Date for the meeting in YYYY-MM-DD format")
     time: str = Field(description="Time for the meeting in HH:MM format (24-hour)")
@@ -75,30 +172,128 @@ class BookMeetingInput(BaseModel):
     attendee_email: str = Field(description="Email of the attendee")
 
 
-class ListBookingsInput(BaseModel):
+class ListBookingsInput(_ToolInput):
     """Input schema for listing bookings."""
     user_email: Optional[str] = Field(description="Email of the user to get bookings for", default=None)
 
 
-class CancelBookingInput(BaseModel):
+class CancelBookingInput(_ToolInput):
     """Input schema for canceling a booking."""
     booking_identifier: str = Field(description="Booking ID or description to identify which booking to cancel")
     reason: Optional[str] = Field(description="Reason for cancellation", default="User requested cancellation")
 
 
-class RescheduleBookingInput(BaseModel):
+class RescheduleBookingInput(_ToolInput):
     """Input schema for rescheduling a booking."""
     booking_identifier: str = Field(description="Booking ID or description to identify which booking to reschedule")
     new_date: str = Field(description="New date for the meeting in YYYY-MM-DD format")
     new_time: str = Field(description="New time for the meeting in HH:MM format (24-hour)")
 
 
-class GetAvailableSlotsInput(BaseModel):
+class GetAvailableSlotsInput(_ToolInput):
     """Input schema for getting available slots."""
     date: str = Field(description="Date to check availability in YYYY-MM-DD format")
     end_date: str = Field(description="End date for range check in YYYY-MM-DD format (optional, defaults to same as start date)", default="")
 
 
+def _async_impl(sync_tool: StructuredTool) -> Callable:
+    """Register the decorated coroutine as a tool's async implementation.
+    
+    The tool keeps its name, schema and description; `ainvoke` runs the
+    coroutine on the async Cal.com client instead of the sync function in
+    a worker thread.
+    """
+    def decorator(coro: Callable) -> Callable:
+        sync_tool.coroutine = coro
+        return coro
+    return decorator
+
+
+def _new_booking_request(meeting_start: str, attendee_name: str, attendee_email: str) -> BookingRequest:
+    """Build a booking request in the Cal.com v2 API format."""
+    return BookingRequest(
+        eventTypeId=EVENT_TYPE_ID,
+        start=meeting_start,
+        attendee={
+            "language": "en",
+            "name": attendee_name,
+            "timeZone": _LA_TZ_NAME,
+            "email": attendee_email
+        },
+        location={
+            "integration": "cal-video",
+            "type": "integration"
+        }
+    )
+
+
+def _unavailable_reply(date: str,
+                       time: str,
+                       meeting_datetime: datetime,
+                       day: datetime,
+                       available_slots: List[AvailableSlot]) -> Optional[str]:
+    """Explain why a meeting can't be booked, or return None if the time is free."""
+    # Check if the requested time is available (slot times start with YYYY-MM-DDTHH:MM)
+    slot_prefixes = {slot.time[:16] for slot in available_slots}
+    if meeting_datetime.isoformat(timespec="minutes") in slot_prefixes:
+        return None
+    
+    # Convert slots to LA timezone, skipping any that can't be parsed
+    slots_la = [t for t in map(_try_convert_utc_to_la, (slot.time for slot in available_slots)) if t]
+    
+    # Prefer other times on the same date
+    same_day = [t for t in slots_la if t.date() == day.date()]
+    if same_day:
+        available_times = [_fmt_time(t) for t in same_day[:5]]  # Show first 5 available slots
+        return f"""The requested time {time} is not available on {date}.
+
+**Available times for {date} (PT):**
+{', '.join(available_times)}
+
+Please choose one of these available times or select a different date."""
+    
+    # Otherwise offer the closest times on the neighbouring days
+    if slots_la:
+        requested_la = _LA_TZ.localize(meeting_datetime)
+        nearest = sorted(sorted(slots_la, key=lambda t: abs(t - requested_la))[:5])
+        return f"""The requested time {time} is not available on {date}, and there are no other open times that day.
+
+**Nearby available times (PT):**
+{', '.join(_fmt_short_datetime(t) for t in nearest)}
+
+Please choose one of these available times or select a different date."""
+    
+    return f"No available slots found for {date}. Please try a different date."
+
+
+def _viewed_slot_is_free(client: CalcomClient, date: str, meeting_datetime: datetime) -> bool:
+    """Check the requested time against the day's slots the user was just shown.
+    
+    get_available_slots leaves that day cached for a short while, so booking
+    one of the listed times needs no second availability request.
+    """
+    viewed = client.get_cached_available_slots(EVENT_TYPE_ID, date, date)
+    return bool(viewed) and meeting_datetime.isoformat(timespec="minutes") in {slot.time[:16] for slot in viewed}
+
+
+def _booked_reply(booking: Booking, meeting_datetime: datetime, attendee_name: str, attendee_email: str) -> str:
+    """Confirmation message for a new booking."""
+    return f"""
+Meeting successfully booked! 
+
+**Meeting Details:**
+- **Title:** {booking.title}
+- **Date & Time:** {_fmt_datetime(meeting_datetime)}
+- **Duration:** 30 minutes
+- **Attendee:** {attendee_name} ({attendee_email})
+- **Booking ID:** {booking.id}
+- **Booking UID:** {booking.uid or 'N/A'}
+- **Location:** Cal Video (online meeting)
+
+The meeting has been confirmed and calendar invites will be sent to all attendees.
+    """.strip()
+
+
 @tool("book_meeting", args_schema=BookMeetingInput)
 def book_meeting(
     date: str,
@@ -117,89 +312,104 @@ def book_meeting(
     try:
         calcom_client = get_calcom_client()
         
-        # Use hardcoded event type ID for 30-minute meetings
-        event_type_id = 3161359
-        
         # Convert LA timezone input to UTC for API
         meeting_start = convert_la_to_utc(date, time)
         
         # Parse for slot checking (still need datetime object)
-        meeting_datetime = datetime.strptime(f"{date} {time}", "%Y-%m-%d %H:%M")
+        meeting_datetime = _parse_local(date, time)
+        
+        if not _viewed_slot_is_free(calcom_client, date, meeting_datetime):
+            # Check the requested day and its neighbours in one call, so there
+            # are alternatives to offer if the requested time is taken
+            day = datetime.fromisoformat(date)
+            available_slots = calcom_client.get_available_slots(
+                event_type_id=EVENT_TYPE_ID,
+                start_date=(day - timedelta(days=1)).strftime("%Y-%m-%d"),
+                end_date=(day + timedelta(days=1)).strftime("%Y-%m-%d")
+            )
+            
+            unavailable = _unavailable_reply(date, time, meeting_datetime, day, available_slots)
+            if unavailable:
+                return unavailable
         
-        # First, check availability using slots API
-        available_slots = calcom_client.get_available_slots(
-            event_type_id=event_type_id,
-            start_date=date,
-            end_date=date
+        # Create the booking
+        booking = calcom_client.create_booking(
+            _new_booking_request(meeting_start, attendee_name, attendee_email)
         )
         
-        # Check if the requested time is available
-        requested_time_matches = [
-            slot for slot in available_slots 
-            if slot.time.startswith(meeting_datetime.strftime("%Y-%m-%dT%H:%M"))
-        ]
-        
-        if not requested_time_matches:
-            if available_slots:
-                # Show available times for the same date (convert to LA timezone)
-                available_times = []
-                for slot in available_slots[:5]:  # Show first 5 available slots
-                    try:
-                        slot_time_la = convert_utc_to_la(slot.time)
-                        available_times.append(slot_time_la.strftime("%I:%M %p"))
-                    except:
-                        continue
-                
-                if available_times:
-                    return f"""The requested time {time} is not available on {date}.
+        return _booked_reply(booking, meeting_datetime, attendee_name, attendee_email)
+        
+    except Exception as e:
+        return f"Error booking meeting: {str(e)}"
 
-**Available times for {date} (PT):**
-{', '.join(available_times)}
 
-Please choose one of these available times or select a different date."""
-                else:
-                    return f"No available slots found for {date}. Please try a different date."
-            else:
-                return f"No available slots found for {date}. Please try a different date."
-        
-        # Create booking request with correct Cal.com v2 API format
-        booking_request = BookingRequest(
-            eventTypeId=event_type_id,
-            start=meeting_start,
-            attendee={
-                "language": "en",
-                "name": attendee_name,
-                "timeZone": "America/Los_Angeles",
-                "email": attendee_email
-            },
-            location={
-                "integration": "cal-video",
-                "type": "integration"
-            }
-        )
+@_async_impl(book_meeting)
+async def abook_meeting(
+    date: str,
+    time: str,
+    title: str,
+    attendee_name: str,
+    attendee_email: str,
+    description: str = ""
+) -> str:
+    """Async version of `book_meeting`."""
+    try:
+        calcom_client = get_calcom_client()
+        meeting_start = convert_la_to_utc(date, time)
+        meeting_datetime = _parse_local(date, time)
+        
+        if not _viewed_slot_is_free(calcom_client, date, meeting_datetime):
+            day = datetime.fromisoformat(date)
+            available_slots = await calcom_client.aget_available_slots(
+                event_type_id=EVENT_TYPE_ID,
+                start_date=(day - timedelta(days=1)).strftime("%Y-%m-%d"),
+                end_date=(day + timedelta(days=1)).strftime("%Y-%m-%d")
+            )
+            
+            unavailable = _unavailable_reply(date, time, meeting_datetime, day, available_slots)
+            if unavailable:
+                return unavailable
         
-        # Create the booking
-        booking = calcom_client.create_booking(booking_request)
+        booking = await calcom_client.acreate_booking(
+            _new_booking_request(meeting_start, attendee_name, attendee_email)
+        )
         
-        return f"""
-Meeting successfully booked! 
-
-**Meeting Details:**
-- **Title:** {booking.title}
-- **Date & Time:** {meeting_datetime.strftime('%B %d, %Y at %I:%M %p')}
-- **Duration:** 30 minutes
-- **Attendee:** {attendee_name} ({attendee_email})
-- **Booking ID:** {booking.id}
-- **Booking UID:** {booking.uid or 'N/A'}
-- **Location:** Cal Video (online meeting)
-
-The meeting has been confirmed and calendar invites will be sent to all attendees.
-        """.strip()
+        return _booked_reply(booking, meeting_datetime, attendee_name, attendee_email)
         
     except Exception as e:
         return f"Error booking meeting: {str(e)}"
 
 
+def _bookings_reply(bookings: List[Booking]) -> str:
+    """Format the list of scheduled meetings.
+    
+    The client returns bookings already sorted by start time.
+    """
+    if not bookings:
+        return "No scheduled meetings found."
+    
+    parts = ["**Your Scheduled Meetings:**\n\n"]
+    
+    for booking in bookings:
+        try:
+            start_time_la = convert_utc_to_la(booking.startTime)
+            end_time_la = convert_utc_to_la(booking.endTime)
+            
+            parts.append(f"""
+**{booking.title}** (ID: {booking.id}, UID: {booking.uid or 'N/A'})
+- **Date & Time:** {_fmt_datetime(start_time_la)} - {_fmt_time(end_time_la)} (PT)
+- **Status:** {booking.status.title()}
+- **Attendees:** {booking.attendees_display}
+- **Description:** {booking.description or 'No description'}
+
+            """.strip() + "\n\n")
+            
+        except (AttributeError, TypeError, ValueError):
+            parts.append(f"**{booking.title}** (ID: {booking.id}, UID: {booking.uid or 'N/A'}) - Error parsing time details\n\n")
+    
+    return "".join(parts).strip()
+
+
 @tool("list_bookings", args_schema=ListBookingsInput)
 def list_bookings(user_email: Optional[str] = None) -> str:
     """List all scheduled meetings/bookings for the user.
@@ -207,46 +417,109 @@ def list_bookings(user_email: Optional[str] = None) -> str:
     Use this when the user wants to see their upcoming appointments or scheduled events.
     """
     try:
-        calcom_client = get_calcom_client()
-        
-        bookings = calcom_client.get_bookings()
-        
-        if not bookings:
-            return "No scheduled meetings found."
-        
-        # Sort bookings by start time
-        bookings.sort(key=lambda b: b.startTime)
-        
-        result = "**Your Scheduled Meetings:**\n\n"
-        
-        for booking in bookings:
-            try:
-                start_time_la = convert_utc_to_la(booking.startTime)
-                end_time_la = convert_utc_to_la(booking.endTime)
-                
-                attendees = ", ".join([
-                    f"{att.get('name', 'Unknown')} ({att.get('email', 'No email')})"
-                    for att in booking.attendees
-                ])
-                
-                result += f"""
-**{booking.title}** (ID: {booking.id}, UID: {booking.uid or 'N/A'})
-- **Date & Time:** {start_time_la.strftime('%B %d, %Y at %I:%M %p')} - {end_time_la.strftime('%I:%M %p')} (PT)
-- **Status:** {booking.status.title()}
-- **Attendees:** {attendees}
-- **Description:** {booking.description or 'No description'}
+        return _bookings_reply(get_calcom_client().get_bookings())
+    except Exception as e:
+        return f"Error retrieving bookings: {str(e)}"
 
-                """.strip() + "\n\n"
-                
-            except Exception as e:
-                result += f"**{booking.title}** (ID: {booking.id}, UID: {booking.uid or 'N/A'}) - Error parsing time details\n\n"
-        
-        return result.strip()
-        
+
+@_async_impl(list_bookings)
+async def alist_bookings(user_email: Optional[str] = None) -> str:
+    """Async version of `list_bookings`."""
+    try:
+        return _bookings_reply(await get_calcom_client().aget_bookings())
     except Exception as e:
         return f"Error retrieving bookings: {str(e)}"
 
 
+def _parse_for_matching(bookings: List[Booking]) -> List[Tuple[Booking, str, Optional[datetime]]]:
+    """Lowercase titles and parse start times once for fuzzy matching.
+    
+    Bookings whose time can't be parsed get None and can still match by title.
+    """
+    return [(b, b.title.lower(), _try_convert_utc_to_la(b.startTime)) for b in bookings]
+
+
+def _fuzzy_cancel_match(parsed: List[Tuple[Booking, str, Optional[datetime]]], identifier: str) -> Optional[Booking]:
+    """Find a booking by title, time or relative day described in the identifier."""
+    identifier_lower = identifier.lower()
+    
+    # Parse the identifier once: the fixed-width "03pm" and "YYYY-MM-DD"
+    # substrings it contains, and the LA dates named by "today"/"tomorrow"
+    time_tokens = {identifier_lower[i:i + 4] for i in range(len(identifier_lower) - 3)}
+    date_tokens = {identifier_lower[i:i + 10] for i in range(len(identifier_lower) - 9)}
+    
+    relative_dates = set()
+    if "today" in identifier_lower or "tomorrow" in identifier_lower:
+        today_la = datetime.now(_LA_TZ).date()
+        if "today" in identifier_lower:
+            relative_dates.add(today_la)
+        if "tomorrow" in identifier_lower:
+            relative_dates.add(today_la + timedelta(days=1))
+    
+    for booking, title_lower, start_time_la in parsed:
+        # Check title
+        if identifier_lower in title_lower:
+            return booking
+        
+        if start_time_la is None:
+            continue
+        
+        # Check time (e.g., "3pm today", "tomorrow at 2")
+        hour = start_time_la.hour
+        if f"{hour % 12 or 12:02d}{'pm' if hour >= 12 else 'am'}" in time_tokens:  # e.g., "03pm"
+            return booking
+        if start_time_la.date().isoformat() in date_tokens:
+            return booking
+        
+        # Check for "today" or "tomorrow" (in LA timezone)
+        if start_time_la.date() in relative_dates:
+            return booking
+    
+    return None
+
+
+def _cancel_target(bookings: List[Booking], identifier: str) -> Tuple[Optional[Booking], Optional[str]]:
+    """Resolve the booking to cancel.
+    
+    Returns:
+        Tuple of (booking, not_found_reply); exactly one of them is set
+    """
+    # Try to find booking by ID or UID first
+    booking = _find_booking_by_key(bookings, identifier)
+    if booking:
+        return booking, None
+    
+    # If not found by ID/UID, search by description/title/time
+    parsed = _parse_for_matching(bookings)
+    booking = _fuzzy_cancel_match(parsed, identifier)
+    if booking:
+        return booking, None
+    
+    # List available bookings to help user
+    booking_list = "\n".join([
+        f"- {b.title} (ID: {b.id}, UID: {b.uid or 'N/A'}) - {_fmt_short_datetime(start or convert_utc_to_la(b.startTime))} (PT)"
+        for b, _, start in parsed
+    ])
+    return None, f"Could not find a booking matching '{identifier}'. Available bookings:\n{booking_list}"
+
+
+def _cancelled_reply(booking: Booking, reason: str) -> str:
+    """Confirmation message for a cancelled booking."""
+    start_time_la = convert_utc_to_la(booking.startTime)
+    return f"""
+**Meeting Canceled Successfully**
+
+**Canceled Meeting:**
+- **Title:** {booking.title}
+- **Date & Time:** {_fmt_datetime(start_time_la)} (PT)
+- **Booking ID:** {booking.id}
+- **Booking UID:** {booking.uid}
+- **Reason:** {reason}
+
+All attendees will be notified of the cancellation.
+    """.strip()
+
+
 @tool("cancel_booking", args_schema=CancelBookingInput)
 def cancel_booking(booking_identifier: str, reason: str = "User requested cancellation") -> str:
     """Cancel a scheduled meeting/booking.
@@ -257,96 +530,137 @@ def cancel_booking(booking_identifier: str, reason: str = "User requested cancel
     try:
         calcom_client = get_calcom_client()
         
-        # First, get all bookings to find the one to cancel
-        bookings = calcom_client.get_bookings()
-        
-        if not bookings:
-            return "No bookings found to cancel."
-        
-        booking_to_cancel = None
-        
-        # Try to find booking by ID or UID first
-        if booking_identifier.isdigit():
-            booking_id = int(booking_identifier)
-            booking_to_cancel = next(
-                (b for b in bookings if b.id == booking_id), 
-                None
-            )
-        else:
-            # Try to find by UID
-            booking_to_cancel = next(
-                (b for b in bookings if b.uid == booking_identifier), 
-                None
-            )
-        
-        # If not found by ID/UID, search by description/title/time
+        # A UID can be fetched directly; otherwise search all bookings
+        booking_to_cancel = _get_booking_by_uid(calcom_client, booking_identifier)
         if not booking_to_cancel:
-            identifier_lower = booking_identifier.lower()
+            bookings = calcom_client.get_bookings()
+            if not bookings:
+                return "No bookings found to cancel."
             
-            for booking in bookings:
-                # Check title
-                if identifier_lower in booking.title.lower():
-                    booking_to_cancel = booking
-                    break
-                
-                # Check time (e.g., "3pm today", "tomorrow at 2")
-                try:
-                    start_time_la = convert_utc_to_la(booking.startTime)
-                    time_str = start_time_la.strftime('%I%p').lower()  # e.g., "3pm"
-                    date_str = start_time_la.strftime('%Y-%m-%d')
-                    
-                    if time_str in identifier_lower or date_str in identifier_lower:
-                        booking_to_cancel = booking
-                        break
-                        
-                    # Check for "today" or "tomorrow" (in LA timezone)
-                    la_tz = pytz.timezone('America/Los_Angeles')
-                    today_la = datetime.now(la_tz).date()
-                    if "today" in identifier_lower and start_time_la.date() == today_la:
-                        booking_to_cancel = booking
-                        break
-                    elif "tomorrow" in identifier_lower and start_time_la.date() == today_la + timedelta(days=1):
-                        booking_to_cancel = booking
-                        break
-                        
-                except Exception:
-                    continue
-        
-        if not booking_to_cancel:
-            # List available bookings to help user
-            booking_list = "\n".join([
-                f"- {b.title} (ID: {b.id}, UID: {b.uid or 'N/A'}) - {convert_utc_to_la(b.startTime).strftime('%B %d at %I:%M %p')} (PT)"
-                for b in bookings
-            ])
-            return f"Could not find a booking matching '{booking_identifier}'. Available bookings:\n{booking_list}"
+            booking_to_cancel, not_found = _cancel_target(bookings, booking_identifier)
+            if not_found:
+                return not_found
         
         if not booking_to_cancel.uid:
             return f"Cannot cancel booking {booking_to_cancel.id}: booking UID is required for cancellation."
         
         # Cancel the booking using UID
-        success = calcom_client.cancel_booking(booking_to_cancel.uid, reason)
-        
-        if success:
-            start_time_la = convert_utc_to_la(booking_to_cancel.startTime)
-            return f"""
-**Meeting Canceled Successfully**
+        if calcom_client.cancel_booking(booking_to_cancel.uid, reason):
+            return _cancelled_reply(booking_to_cancel, reason)
+        return f"Failed to cancel booking {booking_to_cancel.uid}. Please try again or contact support."
+            
+    except Exception as e:
+        return f"Error canceling booking: {str(e)}"
 
-**Canceled Meeting:**
-- **Title:** {booking_to_cancel.title}
-- **Date & Time:** {start_time_la.strftime('%B %d, %Y at %I:%M %p')} (PT)
-- **Booking ID:** {booking_to_cancel.id}
-- **Booking UID:** {booking_to_cancel.uid}
-- **Reason:** {reason}
 
-All attendees will be notified of the cancellation.
-            """.strip()
-        else:
-            return f"Failed to cancel booking {booking_to_cancel.uid}. Please try again or contact support."
+@_async_impl(cancel_booking)
+async def acancel_booking(booking_identifier: str, reason: str = "User requested cancellation") -> str:
+    """Async version of `cancel_booking`."""
+    try:
+        calcom_client = get_calcom_client()
+        
+        booking_to_cancel = await _aget_booking_by_uid(calcom_client, booking_identifier)
+        if not booking_to_cancel:
+            bookings = await calcom_client.aget_bookings()
+            if not bookings:
+                return "No bookings found to cancel."
+            
+            booking_to_cancel, not_found = _cancel_target(bookings, booking_identifier)
+            if not_found:
+                return not_found
+        
+        if not booking_to_cancel.uid:
+            return f"Cannot cancel booking {booking_to_cancel.id}: booking UID is required for cancellation."
+        
+        if await calcom_client.acancel_booking(booking_to_cancel.uid, reason):
+            return _cancelled_reply(booking_to_cancel, reason)
+        return f"Failed to cancel booking {booking_to_cancel.uid}. Please try again or contact support."
             
     except Exception as e:
         return f"Error canceling booking: {str(e)}"
 
 
+def _reschedule_target(bookings: List[Booking], identifier: str) -> Tuple[Optional[Booking], Optional[str]]:
+    """Resolve the booking to reschedule.
+    
+    Returns:
+        Tuple of (booking, not_found_reply); exactly one of them is set
+    """
+    # Try to find booking by ID or UID first
+    booking = _find_booking_by_key(bookings, identifier)
+    
+    # If not found by ID/UID, search by description
+    if not booking:
+        identifier_lower = identifier.lower()
+        booking = next(
+            (b for b in bookings if identifier_lower in b.title.lower()),
+            None
+        )
+    if booking:
+        return booking, None
+    
+    booking_list = "\n".join([
+        f"- {b.title} (ID: {b.id}, UID: {b.uid or 'N/A'})"
+        for b in bookings
+    ])
+    return None, f"Could not find a booking matching '{identifier}'. Available bookings:\n{booking_list}"
+
+
+def _reschedule_unavailable_reply(new_date: str,
+                                  new_time: str,
+                                  new_datetime: datetime,
+                                  available_slots: List[AvailableSlot]) -> Optional[str]:
+    """Explain why a booking can't move to the new time, or return None if it's free."""
+    # Check if the new requested time is available
+    slot_prefixes = {slot.time[:16] for slot in available_slots}
+    if new_datetime.isoformat(timespec="minutes") in slot_prefixes:
+        return None
+    
+    # Show available times for the new date (convert to LA timezone)
+    available_times = [
+        _fmt_time(t)
+        for t in map(_try_convert_utc_to_la, (slot.time for slot in available_slots[:5]))  # Show first 5 available slots
+        if t
+    ]
+    if available_times:
+        return f"""The requested new time {new_time} is not available on {new_date}.
+
+**Available times for {new_date} (PT):**
+{', '.join(available_times)}
+
+Please choose one of these available times or select a different date for rescheduling."""
+    return f"No available slots found for {new_date}. Please try a different date for rescheduling."
+
+
+def _original_timing(original: Booking) -> Tuple[datetime, timedelta]:
+    """Return the LA start time and duration of a booking before it moves."""
+    # Get original timing for comparison (convert to LA timezone for display)
+    original_start = _parse_utc(original.startTime)
+    return original_start.astimezone(_LA_TZ), _parse_utc(original.endTime) - original_start
+
+
+def _rescheduled_reply(updated: Booking,
+                       original_start_la: datetime,
+                       duration: timedelta,
+                       new_datetime: datetime) -> str:
+    """Confirmation message for a rescheduled booking."""
+    # new_datetime is already LA wall-clock time, which is all the display needs
+    return f"""
+**Meeting Rescheduled Successfully**
+
+**Original Time:** {_fmt_datetime(original_start_la)} (PT)
+**New Time:** {_fmt_datetime(new_datetime)} (PT)
+
+**Meeting Details:**
+- **Title:** {updated.title}
+- **Duration:** {int(duration.total_seconds() / 60)} minutes
+- **Booking ID:** {updated.id}
+- **Booking UID:** {updated.uid}
+
+All attendees will be notified of the schedule change.
+    """.strip()
+
+
 @tool("reschedule_booking", args_schema=RescheduleBookingInput)
 def reschedule_booking(booking_identifier: str, new_date: str, new_time: str) -> str:
     """Reschedule an existing meeting to a new date and time.
@@ -356,125 +670,160 @@ def reschedule_booking(booking_identifier: str, new_date: str, new_time: str) ->
     try:
         calcom_client = get_calcom_client()
         
-        # Find the booking to reschedule (similar logic to cancel)
-        bookings = calcom_client.get_bookings()
-        
-        if not bookings:
-            return "No bookings found to reschedule."
-        
-        booking_to_reschedule = None
-        
-        # Try to find booking by ID or UID first
-        if booking_identifier.isdigit():
-            booking_id = int(booking_identifier)
-            booking_to_reschedule = next(
-                (b for b in bookings if b.id == booking_id), 
-                None
-            )
-        else:
-            # Try to find by UID
-            booking_to_reschedule = next(
-                (b for b in bookings if b.uid == booking_identifier), 
-                None
-            )
-        
-        # If not found by ID/UID, search by description
-        if not booking_to_reschedule:
-            identifier_lower = booking_identifier.lower()
-            for booking in bookings:
-                if identifier_lower in booking.title.lower():
-                    booking_to_reschedule = booking
-                    break
-        
-        if not booking_to_reschedule:
-            booking_list = "\n".join([
-                f"- {b.title} (ID: {b.id}, UID: {b.uid or 'N/A'})"
-                for b in bookings
-            ])
-            return f"Could not find a booking matching '{booking_identifier}'. Available bookings:\n{booking_list}"
-        
-        if not booking_to_reschedule.uid:
-            return f"Cannot reschedule booking {booking_to_reschedule.id}: booking UID is required for rescheduling."
-        
         # Convert new LA timezone input to UTC for API
         new_start_utc = convert_la_to_utc(new_date, new_time)
         
         # Parse for slot checking and display (still need datetime object)
-        new_datetime = datetime.strptime(f"{new_date} {new_time}", "%Y-%m-%d %H:%M")
+        new_datetime = _parse_local(new_date, new_time)
         
-        # Check availability for the new time slot
-        event_type_id = 3161359  # Use the same event type ID
-        available_slots = calcom_client.get_available_slots(
-            event_type_id=event_type_id,
+        # The availability check doesn't depend on which booking matches,
+        # so fetch it alongside the booking lookup
+        slots_future = _io_pool.submit(
+            calcom_client.get_available_slots,
+            event_type_id=EVENT_TYPE_ID,
             start_date=new_date,
             end_date=new_date
         )
         
-        # Check if the new requested time is available
-        new_time_matches = [
-            slot for slot in available_slots 
-            if slot.time.startswith(new_datetime.strftime("%Y-%m-%dT%H:%M"))
-        ]
-        
-        if not new_time_matches:
-            if available_slots:
-                # Show available times for the new date (convert to LA timezone)
-                available_times = []
-                for slot in available_slots[:5]:  # Show first 5 available slots
-                    try:
-                        slot_time_la = convert_utc_to_la(slot.time)
-                        available_times.append(slot_time_la.strftime("%I:%M %p"))
-                    except:
-                        continue
+        # Drop the availability request if it hasn't started by an early return
+        try:
+            # Find the booking to reschedule (similar logic to cancel)
+            booking_to_reschedule = _get_booking_by_uid(calcom_client, booking_identifier)
+            if not booking_to_reschedule:
+                bookings = calcom_client.get_bookings()
+                if not bookings:
+                    return "No bookings found to reschedule."
                 
-                if available_times:
-                    return f"""The requested new time {new_time} is not available on {new_date}.
-
-**Available times for {new_date} (PT):**
-{', '.join(available_times)}
-
-Please choose one of these available times or select a different date for rescheduling."""
-                else:
-                    return f"No available slots found for {new_date}. Please try a different date for rescheduling."
-            else:
-                return f"No available slots found for {new_date}. Please try a different date for rescheduling."
-        
-        # Get original timing for comparison (convert to LA timezone for display)
-        original_start_la = convert_utc_to_la(booking_to_reschedule.startTime)
-        original_end_utc = datetime.fromisoformat(booking_to_reschedule.startTime.replace('Z', '+00:00'))
-        end_time_utc = datetime.fromisoformat(booking_to_reschedule.endTime.replace('Z', '+00:00'))
-        duration = end_time_utc - original_end_utc
-        
-        # Reschedule the booking using UID
-        updated_booking = calcom_client.reschedule_booking(
-            booking_to_reschedule.uid,
-            new_start_utc
-        )
+                booking_to_reschedule, not_found = _reschedule_target(bookings, booking_identifier)
+                if not_found:
+                    return not_found
+            
+            if not booking_to_reschedule.uid:
+                return f"Cannot reschedule booking {booking_to_reschedule.id}: booking UID is required for rescheduling."
+            
+            # Check availability for the new time slot
+            unavailable = _reschedule_unavailable_reply(new_date, new_time, new_datetime, slots_future.result())
+            if unavailable:
+                return unavailable
+            
+            # Parse the original timing before the write, so a malformed booking
+            # can't turn a successful reschedule into an error reply
+            original_start_la, duration = _original_timing(booking_to_reschedule)
+            
+            # Reschedule the booking using UID
+            updated_booking = calcom_client.reschedule_booking(
+                booking_to_reschedule.uid,
+                new_start_utc
+            )
+            
+            if updated_booking:
+                return _rescheduled_reply(updated_booking, original_start_la, duration, new_datetime)
+            return f"Failed to reschedule booking {booking_to_reschedule.uid}. Please try again or contact support."
+        finally:
+            slots_future.cancel()
         
-        if updated_booking:
-            # Convert new time to LA timezone for display
-            new_datetime_la = pytz.timezone('America/Los_Angeles').localize(new_datetime)
-            return f"""
-**Meeting Rescheduled Successfully**
-
-**Original Time:** {original_start_la.strftime('%B %d, %Y at %I:%M %p')} (PT)
-**New Time:** {new_datetime_la.strftime('%B %d, %Y at %I:%M %p')} (PT)
+    except Exception as e:
+        return f"Error rescheduling booking: {str(e)}"
 
-**Meeting Details:**
-- **Title:** {updated_booking.title}
-- **Duration:** {int(duration.total_seconds() / 60)} minutes
-- **Booking ID:** {updated_booking.id}
-- **Booking UID:** {updated_booking.uid}
 
-All attendees will be notified of the schedule change.
-            """.strip()
-        else:
+@_async_impl(reschedule_booking)
+async def areschedule_booking(booking_identifier: str, new_date: str, new_time: str) -> str:
+    """Async version of `reschedule_booking`."""
+    try:
+        calcom_client = get_calcom_client()
+        
+        # Fetch availability concurrently with the booking lookup
+        slots_task = asyncio.ensure_future(calcom_client.aget_available_slots(
+            event_type_id=EVENT_TYPE_ID,
+            start_date=new_date,
+            end_date=new_date
+        ))
+        
+        # Don't leave the availability request running on an early return
+        try:
+            booking_to_reschedule = await _aget_booking_by_uid(calcom_client, booking_identifier)
+            if not booking_to_reschedule:
+                bookings = await calcom_client.aget_bookings()
+                if not bookings:
+                    return "No bookings found to reschedule."
+                
+                booking_to_reschedule, not_found = _reschedule_target(bookings, booking_identifier)
+                if not_found:
+                    return not_found
+            
+            if not booking_to_reschedule.uid:
+                return f"Cannot reschedule booking {booking_to_reschedule.id}: booking UID is required for rescheduling."
+            
+            new_start_utc = convert_la_to_utc(new_date, new_time)
+            new_datetime = _parse_local(new_date, new_time)
+            
+            unavailable = _reschedule_unavailable_reply(new_date, new_time, new_datetime, await slots_task)
+            if unavailable:
+                return unavailable
+            
+            # Parse the original timing before the write, so a malformed booking
+            # can't turn a successful reschedule into an error reply
+            original_start_la, duration = _original_timing(booking_to_reschedule)
+            
+            updated_booking = await calcom_client.areschedule_booking(
+                booking_to_reschedule.uid,
+                new_start_utc
+            )
+            
+            if updated_booking:
+                return _rescheduled_reply(updated_booking, original_start_la, duration, new_datetime)
             return f"Failed to reschedule booking {booking_to_reschedule.uid}. Please try again or contact support."
+        finally:
+            if not slots_task.done():
+                slots_task.cancel()
+            elif not slots_task.cancelled():
+                # Retrieve any failure so it isn't logged as never retrieved
+                slots_task.exception()
         
     except Exception as e:
         return f"Error rescheduling booking: {str(e)}"
 
 
+def _slots_reply(date: str, end_date: str, available_slots: List[AvailableSlot]) -> str:
+    """Format available slots grouped by date."""
+    if not available_slots:
+        if date == end_date:
+            return f"No available slots found for {date}. Please try a different date."
+        else:
+            return f"No available slots found between {date} and {end_date}. Please try different dates."
+    
+    # Group slots by date and convert to LA timezone; times are formatted
+    # only when rendering so they sort chronologically rather than as text
+    slots_by_date = {}
+    for slot in available_slots:
+        slot_time_la = _try_convert_utc_to_la(slot.time)
+        if slot_time_la is None:
+            continue
+        
+        slot_date = slot_time_la.date()
+        if slot_date not in slots_by_date:
+            slots_by_date[slot_date] = []
+        slots_by_date[slot_date].append(slot_time_la)
+    
+    if not slots_by_date:
+        return f"No valid time slots found. Please try a different date."
+    
+    # Format the response
+    if date == end_date:
+        parts = [f"**Available time slots for {date} (PT):**\n\n"]
+    else:
+        parts = [f"**Available time slots from {date} to {end_date} (PT):**\n\n"]
+    
+    for slot_date in sorted(slots_by_date):
+        times = ', '.join(_fmt_time(t) for t in sorted(slots_by_date[slot_date]))
+        parts.append(f"**{_fmt_date(slot_date)}:**\n{times}\n\n")
+    
+    parts.append("You can book any of these available times by saying something like:\n")
+    parts.append(f'"Book a meeting on {date} at [time] with [attendee name] [attendee email]"')
+    
+    return "".join(parts).strip()
+
+
 @tool("get_available_slots", args_schema=GetAvailableSlotsInput)
 def get_available_slots(date: str, end_date: str = "") -> str:
     """Get available time slots for scheduling meetings.
@@ -483,68 +832,42 @@ def get_available_slots(date: str, end_date: str = "") -> str:
     Shows available slots for a specific date or date range.
     """
     try:
-        calcom_client = get_calcom_client()
-        
-        # Use hardcoded event type ID
-        event_type_id = 3161359
-        
         # Use same date for end if not provided
-        if not end_date or end_date == "":
-            end_date = date
+        end_date = end_date or date
         
         # Get available slots from API
-        available_slots = calcom_client.get_available_slots(
-            event_type_id=event_type_id,
+        available_slots = get_calcom_client().get_available_slots(
+            event_type_id=EVENT_TYPE_ID,
             start_date=date,
             end_date=end_date
         )
+        return _slots_reply(date, end_date, available_slots)
         
-        if not available_slots:
-            if date == end_date:
-                return f"No available slots found for {date}. Please try a different date."
-            else:
-                return f"No available slots found between {date} and {end_date}. Please try different dates."
-        
-        # Group slots by date and convert to LA timezone
-        slots_by_date = {}
-        for slot in available_slots:
-            try:
-                slot_time_la = convert_utc_to_la(slot.time)
-                slot_date = slot_time_la.strftime('%Y-%m-%d')
-                slot_time_formatted = slot_time_la.strftime('%I:%M %p')
-                
-                if slot_date not in slots_by_date:
-                    slots_by_date[slot_date] = []
-                slots_by_date[slot_date].append(slot_time_formatted)
-            except:
-                continue
-        
-        if not slots_by_date:
-            return f"No valid time slots found. Please try a different date."
-        
-        # Format the response
-        if date == end_date:
-            result = f"**Available time slots for {date} (PT):**\n\n"
-        else:
-            result = f"**Available time slots from {date} to {end_date} (PT):**\n\n"
-        
-        for slot_date in sorted(slots_by_date.keys()):
-            date_obj = datetime.strptime(slot_date, '%Y-%m-%d')
-            formatted_date = date_obj.strftime('%B %d, %Y')
-            times = ', '.join(sorted(slots_by_date[slot_date]))
-            result += f"**{formatted_date}:**\n{times}\n\n"
-        
-        result += "You can book any of these available times by saying something like:\n"
-        result += f'"Book a meeting on {date} at [time] with [attendee name] [attendee email]"'
-        
-        return result.strip()
+    except Exception as e:
+        return f"Error getting available slots: {str(e)}"
+
+
+@_async_impl(get_available_slots)
+async def aget_available_slots(date: str, end_date: str = "") -> str:
+    """Async version of `get_available_slots`."""
+    try:
+        end_date = end_date or date
+        available_slots = await get_calcom_client().aget_available_slots(
+            event_type_id=EVENT_TYPE_ID,
+            start_date=date,
+            end_date=end_date
+        )
+        return _slots_reply(date, end_date, available_slots)
         
     except Exception as e:
         return f"Error getting available slots: {str(e)}"
 
 
 def get_calendar_tools():
-    """Get all calendar tools."""
+    """Get all calendar tools.
+    
+    Each tool supports both `invoke` and `ainvoke`.
+    """
     return [
         book_meeting,
         list_bookings,
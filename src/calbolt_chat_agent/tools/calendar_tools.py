@@ -1,56 +1,29 @@
 """LangChain tools for calendar operations using Cal.com API."""
 
-import json
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
-import pytz
+from typing import List, Optional
 from langchain.tools import BaseTool
 from pydantic import BaseModel, Field
 
-from ..api.calcom_client import CalcomClient, BookingRequest
-from ..config.settings import settings
-
-
-def convert_utc_to_la(utc_time_str: str) -> datetime:
-    """Convert UTC time string to America/Los_Angeles timezone."""
-    try:
-        # Parse UTC time (handle both formats: with and without 'Z')
-        if utc_time_str.endswith('Z'):
-            utc_dt = datetime.fromisoformat(utc_time_str.replace('Z', '+00:00'))
-        else:
-            utc_dt = datetime.fromisoformat(utc_time_str + '+00:00')
-        
-        # Convert to LA timezone
-        la_tz = pytz.timezone('America/Los_Angeles')
-        la_dt = utc_dt.astimezone(la_tz)
-        return la_dt
-    except:
-        # Fallback: treat as UTC and convert
-        utc_dt = datetime.fromisoformat(utc_time_str.replace('Z', '+00:00'))
-        la_tz = pytz.timezone('America/Los_Angeles')
-        return utc_dt.astimezone(la_tz)
-
-
-def convert_la_to_utc(date_str: str, time_str: str) -> str:
-    """Convert LA timezone date/time to UTC ISO format for API calls.
-    
-    Args:
-        date_str: Date in YYYY-MM-DD format
-        time_str: Time in HH:MM format (24-hour)
-        
-    Returns:
-        UTC time in ISO format (e.g., "2025-08-26T23:00:00Z")
-    """
-    # Parse as LA timezone datetime
-    la_tz = pytz.timezone('America/Los_Angeles')
-    naive_datetime = datetime.strptime(f"{date_str} {time_str}", "%Y-%m-%d %H:%M")
-    la_datetime = la_tz.localize(naive_datetime)
-    
-    # Convert to UTC
-    utc_datetime = la_datetime.astimezone(pytz.UTC)
-    
-    # Return in Cal.com API format
-    return utc_datetime.strftime("%Y-%m-%dT%H:%M:%SZ")
+from ..api.calcom_client import CalcomClient, BookingRequest, get_client
+from .calendar_functions import (
+    EVENT_TYPE_ID,
+    _LA_TZ,
+    _LA_TZ_NAME,
+    _find_booking_by_key,
+    _fmt_datetime,
+    _fmt_short_datetime,
+    _fmt_time,
+    _original_timing,
+    _parse_local,
+    _slots_reply,
+    convert_la_to_utc,
+    convert_utc_to_la,
+)
+
+# A booking's time can only match an identifier containing one of these
+# ("03pm", "2025-08-26", "today", "tomorrow")
+_TIME_HINTS = ("am", "pm", "-", "today", "tomorrow")
 
 
 class BookMeetingInput(BaseModel):
@@ -87,7 +60,13 @@ class GetAvailableSlotsInput(BaseModel):
     end_date: str = Field(description="End date for range check in YYYY-MM-DD format (optional, defaults to same as start date)", default="")
 
 
-class BookMeetingTool(BaseTool):
+class CalendarBaseTool(BaseTool):
+    """Base class for calendar tools that share one Cal.com client."""
+    
+    calcom_client: CalcomClient = Field(default_factory=get_client, exclude=True)
+
+
+class BookMeetingTool(CalendarBaseTool):
     """Tool for booking a new meeting."""
     
     name: str = "book_meeting"
@@ -98,49 +77,37 @@ class BookMeetingTool(BaseTool):
     """
     args_schema: type[BaseModel] = BookMeetingInput
     
-    def __init__(self, calcom_client: Optional[CalcomClient] = None):
-        super().__init__()
-        self.calcom_client = calcom_client or CalcomClient()
-    
     def _run(self, **kwargs) -> str:
         """Book a meeting with the provided details."""
         try:
-            input_data = BookMeetingInput(**kwargs)
-            
-            # Use hardcoded event type ID for 30-minute meetings
-            event_type_id = 3161359
+            # BaseTool.run has already validated kwargs against args_schema
+            input_data = BookMeetingInput.model_construct(**kwargs)
             
             # Convert LA timezone input to UTC for API
             meeting_start = convert_la_to_utc(input_data.date, input_data.time)
             
             # Parse for slot checking (still need datetime object)
-            meeting_datetime = datetime.strptime(
-                f"{input_data.date} {input_data.time}", 
-                "%Y-%m-%d %H:%M"
-            )
+            meeting_datetime = _parse_local(input_data.date, input_data.time)
             
             # First, check availability using slots API
             available_slots = self.calcom_client.get_available_slots(
-                event_type_id=event_type_id,
+                event_type_id=EVENT_TYPE_ID,
                 start_date=input_data.date,
                 end_date=input_data.date
             )
             
-            # Check if the requested time is available
-            requested_time_matches = [
-                slot for slot in available_slots 
-                if slot.time.startswith(meeting_datetime.strftime("%Y-%m-%dT%H:%M"))
-            ]
+            # Check if the requested time is available (slot times start with YYYY-MM-DDTHH:MM)
+            slot_prefixes = {slot.time[:16] for slot in available_slots}
             
-            if not requested_time_matches:
+            if meeting_datetime.isoformat(timespec="minutes") not in slot_prefixes:
                 if available_slots:
                     # Show available times for the same date (convert to LA timezone)
                     available_times = []
                     for slot in available_slots[:5]:  # Show first 5 available slots
                         try:
                             slot_time_la = convert_utc_to_la(slot.time)
-                            available_times.append(slot_time_la.strftime("%I:%M %p"))
-                        except:
+                            available_times.append(_fmt_time(slot_time_la))
+                        except (TypeError, ValueError):
                             continue
                     
                     if available_times:
@@ -157,12 +124,12 @@ Please choose one of these available times or select a different date."""
             
             # Create booking request with correct Cal.com v2 API format
             booking_request = BookingRequest(
-                eventTypeId=event_type_id,
+                eventTypeId=EVENT_TYPE_ID,
                 start=meeting_start,
                 attendee={
                     "language": "en",
                     "name": input_data.attendee_name,
-                    "timeZone": "America/Los_Angeles",
+                    "timeZone": _LA_TZ_NAME,
                     "email": input_data.attendee_email
                 },
                 location={
@@ -179,7 +146,7 @@ Meeting successfully booked!
 
 **Meeting Details:**
 - **Title:** {booking.title}
-- **Date & Time:** {meeting_datetime.strftime('%B %d, %Y at %I:%M %p')}
+- **Date & Time:** {_fmt_datetime(meeting_datetime)}
 - **Duration:** 30 minutes
 - **Attendee:** {input_data.attendee_name} ({input_data.attendee_email})
 - **Booking ID:** {booking.id}
@@ -193,7 +160,7 @@ The meeting has been confirmed and calendar invites will be sent to all attendee
             return f"Error booking meeting: {str(e)}"
 
 
-class ListBookingsTool(BaseTool):
+class ListBookingsTool(CalendarBaseTool):
     """Tool for listing scheduled bookings."""
     
     name: str = "list_bookings"
@@ -203,14 +170,11 @@ class ListBookingsTool(BaseTool):
     """
     args_schema: type[BaseModel] = ListBookingsInput
     
-    def __init__(self, calcom_client: Optional[CalcomClient] = None):
-        super().__init__()
-        self.calcom_client = calcom_client or CalcomClient()
-    
     def _run(self, **kwargs) -> str:
         """List all bookings for the user."""
         try:
-            input_data = ListBookingsInput(**kwargs)
+            # BaseTool.run has already validated kwargs against args_schema
+            input_data = ListBookingsInput.model_construct(**kwargs)
             
             bookings = self.calcom_client.get_bookings()
             
@@ -220,7 +184,7 @@ class ListBookingsTool(BaseTool):
             # Sort bookings by start time
             bookings.sort(key=lambda b: b.startTime)
             
-            result = "**Your Scheduled Meetings:**\n\n"
+            parts = ["**Your Scheduled Meetings:**\n\n"]
             
             for booking in bookings:
                 try:
@@ -232,25 +196,25 @@ class ListBookingsTool(BaseTool):
                         for att in booking.attendees
                     ])
                     
-                    result += f"""
+                    parts.append(f"""
 **{booking.title}** (ID: {booking.id}, UID: {booking.uid or 'N/A'})
-- **Date & Time:** {start_time_la.strftime('%B %d, %Y at %I:%M %p')} - {end_time_la.strftime('%I:%M %p')} (PT)
+- **Date & Time:** {_fmt_datetime(start_time_la)} - {_fmt_time(end_time_la)} (PT)
 - **Status:** {booking.status.title()}
 - **Attendees:** {attendees}
 - **Description:** {booking.description or 'No description'}
 
-                    """.strip() + "\n\n"
+                    """.strip() + "\n\n")
                     
-                except Exception as e:
-                    result += f"**{booking.title}** (ID: {booking.id}, UID: {booking.uid or 'N/A'}) - Error parsing time details\n\n"
+                except (AttributeError, TypeError, ValueError):
+                    parts.append(f"**{booking.title}** (ID: {booking.id}, UID: {booking.uid or 'N/A'}) - Error parsing time details\n\n")
             
-            return result.strip()
+            return "".join(parts).strip()
             
         except Exception as e:
             return f"Error retrieving bookings: {str(e)}"
 
 
-class CancelBookingTool(BaseTool):
+class CancelBookingTool(CalendarBaseTool):
     """Tool for canceling a scheduled booking."""
     
     name: str = "cancel_booking"
@@ -261,14 +225,11 @@ class CancelBookingTool(BaseTool):
     """
     args_schema: type[BaseModel] = CancelBookingInput
     
-    def __init__(self, calcom_client: Optional[CalcomClient] = None):
-        super().__init__()
-        self.calcom_client = calcom_client or CalcomClient()
-    
     def _run(self, **kwargs) -> str:
         """Cancel a booking."""
         try:
-            input_data = CancelBookingInput(**kwargs)
+            # BaseTool.run has already validated kwargs against args_schema
+            input_data = CancelBookingInput.model_construct(**kwargs)
             
             # First, get all bookings to find the one to cancel
             bookings = self.calcom_client.get_bookings()
@@ -276,25 +237,17 @@ class CancelBookingTool(BaseTool):
             if not bookings:
                 return "No bookings found to cancel."
             
-            booking_to_cancel = None
-            
             # Try to find booking by ID or UID first
-            if input_data.booking_identifier.isdigit():
-                booking_id = int(input_data.booking_identifier)
-                booking_to_cancel = next(
-                    (b for b in bookings if b.id == booking_id), 
-                    None
-                )
-            else:
-                # Try to find by UID
-                booking_to_cancel = next(
-                    (b for b in bookings if b.uid == input_data.booking_identifier), 
-                    None
-                )
+            booking_to_cancel = _find_booking_by_key(bookings, input_data.booking_identifier)
             
             # If not found by ID/UID, search by description/title/time
             if not booking_to_cancel:
                 identifier_lower = input_data.booking_identifier.lower()
+                match_time = any(hint in identifier_lower for hint in _TIME_HINTS)
+                
+                # "today"/"tomorrow" are relative to the current date in LA
+                today_la = datetime.now(_LA_TZ).date()
+                tomorrow_la = today_la + timedelta(days=1)
                 
                 for booking in bookings:
                     # Check title
@@ -302,33 +255,35 @@ class CancelBookingTool(BaseTool):
                         booking_to_cancel = booking
                         break
                     
+                    if not match_time:
+                        continue
+                    
                     # Check time (e.g., "3pm today", "tomorrow at 2")
                     try:
                         start_time_la = convert_utc_to_la(booking.startTime)
-                        time_str = start_time_la.strftime('%I%p').lower()  # e.g., "3pm"
-                        date_str = start_time_la.strftime('%Y-%m-%d')
+                        hour = start_time_la.hour
+                        time_str = f"{hour % 12 or 12:02d}{'pm' if hour >= 12 else 'am'}"  # e.g., "03pm"
+                        date_str = start_time_la.date().isoformat()
                         
                         if time_str in identifier_lower or date_str in identifier_lower:
                             booking_to_cancel = booking
                             break
                             
                         # Check for "today" or "tomorrow" (in LA timezone)
-                        la_tz = pytz.timezone('America/Los_Angeles')
-                        today_la = datetime.now(la_tz).date()
                         if "today" in identifier_lower and start_time_la.date() == today_la:
                             booking_to_cancel = booking
                             break
-                        elif "tomorrow" in identifier_lower and start_time_la.date() == today_la + timedelta(days=1):
+                        elif "tomorrow" in identifier_lower and start_time_la.date() == tomorrow_la:
                             booking_to_cancel = booking
                             break
                             
-                    except Exception:
+                    except (TypeError, ValueError):
                         continue
             
             if not booking_to_cancel:
                 # List available bookings to help user
                 booking_list = "\n".join([
-                    f"- {b.title} (ID: {b.id}, UID: {b.uid or 'N/A'}) - {convert_utc_to_la(b.startTime).strftime('%B %d at %I:%M %p')} (PT)"
+                    f"- {b.title} (ID: {b.id}, UID: {b.uid or 'N/A'}) - {_fmt_short_datetime(convert_utc_to_la(b.startTime))} (PT)"
                     for b in bookings
                 ])
                 return f"Could not find a booking matching '{input_data.booking_identifier}'. Available bookings:\n{booking_list}"
@@ -346,7 +301,7 @@ class CancelBookingTool(BaseTool):
 
 **Canceled Meeting:**
 - **Title:** {booking_to_cancel.title}
-- **Date & Time:** {start_time_la.strftime('%B %d, %Y at %I:%M %p')} (PT)
+- **Date & Time:** {_fmt_datetime(start_time_la)} (PT)
 - **Booking ID:** {booking_to_cancel.id}
 - **Booking UID:** {booking_to_cancel.uid}
 - **Reason:** {input_data.reason}
@@ -360,7 +315,7 @@ All attendees will be notified of the cancellation.
             return f"Error canceling booking: {str(e)}"
 
 
-class RescheduleBookingTool(BaseTool):
+class RescheduleBookingTool(CalendarBaseTool):
     """Tool for rescheduling a booking to a new time."""
     
     name: str = "reschedule_booking"
@@ -370,14 +325,11 @@ class RescheduleBookingTool(BaseTool):
     """
     args_schema: type[BaseModel] = RescheduleBookingInput
     
-    def __init__(self, calcom_client: Optional[CalcomClient] = None):
-        super().__init__()
-        self.calcom_client = calcom_client or CalcomClient()
-    
     def _run(self, **kwargs) -> str:
         """Reschedule a booking to a new time."""
         try:
-            input_data = RescheduleBookingInput(**kwargs)
+            # BaseTool.run has already validated kwargs against args_schema
+            input_data = RescheduleBookingInput.model_construct(**kwargs)
             
             # Find the booking to reschedule (similar logic to cancel)
             bookings = self.calcom_client.get_bookings()
@@ -385,21 +337,8 @@ class RescheduleBookingTool(BaseTool):
             if not bookings:
                 return "No bookings found to reschedule."
             
-            booking_to_reschedule = None
-            
             # Try to find booking by ID or UID first
-            if input_data.booking_identifier.isdigit():
-                booking_id = int(input_data.booking_identifier)
-                booking_to_reschedule = next(
-                    (b for b in bookings if b.id == booking_id), 
-                    None
-                )
-            else:
-                # Try to find by UID
-                booking_to_reschedule = next(
-                    (b for b in bookings if b.uid == input_data.booking_identifier), 
-                    None
-                )
+            booking_to_reschedule = _find_booking_by_key(bookings, input_data.booking_identifier)
             
             # If not found by ID/UID, search by description
             if not booking_to_reschedule:
@@ -423,34 +362,27 @@ class RescheduleBookingTool(BaseTool):
             new_start_utc = convert_la_to_utc(input_data.new_date, input_data.new_time)
             
             # Parse for slot checking and display (still need datetime object)
-            new_datetime = datetime.strptime(
-                f"{input_data.new_date} {input_data.new_time}", 
-                "%Y-%m-%d %H:%M"
-            )
+            new_datetime = _parse_local(input_data.new_date, input_data.new_time)
             
             # Check availability for the new time slot
-            event_type_id = 3161359  # Use the same event type ID
             available_slots = self.calcom_client.get_available_slots(
-                event_type_id=event_type_id,
+                event_type_id=EVENT_TYPE_ID,
                 start_date=input_data.new_date,
                 end_date=input_data.new_date
             )
             
             # Check if the new requested time is available
-            new_time_matches = [
-                slot for slot in available_slots 
-                if slot.time.startswith(new_datetime.strftime("%Y-%m-%dT%H:%M"))
-            ]
+            slot_prefixes = {slot.time[:16] for slot in available_slots}
             
-            if not new_time_matches:
+            if new_datetime.isoformat(timespec="minutes") not in slot_prefixes:
                 if available_slots:
                     # Show available times for the new date (convert to LA timezone)
                     available_times = []
                     for slot in available_slots[:5]:  # Show first 5 available slots
                         try:
                             slot_time_la = convert_utc_to_la(slot.time)
-                            available_times.append(slot_time_la.strftime("%I:%M %p"))
-                        except:
+                            available_times.append(_fmt_time(slot_time_la))
+                        except (TypeError, ValueError):
                             continue
                     
                     if available_times:
@@ -465,11 +397,8 @@ Please choose one of these available times or select a different date for resche
                 else:
                     return f"No available slots found for {input_data.new_date}. Please try a different date for rescheduling."
             
-            # Get original timing for comparison (convert to LA timezone for display)
-            original_start_la = convert_utc_to_la(booking_to_reschedule.startTime)
-            original_end_utc = datetime.fromisoformat(booking_to_reschedule.startTime.replace('Z', '+00:00'))
-            end_time_utc = datetime.fromisoformat(booking_to_reschedule.endTime.replace('Z', '+00:00'))
-            duration = end_time_utc - original_end_utc
+            # Get original timing for comparison (LA timezone for display)
+            original_start_la, duration = _original_timing(booking_to_reschedule)
             
             # Reschedule the booking using UID
             updated_booking = self.calcom_client.reschedule_booking(
@@ -478,13 +407,12 @@ Please choose one of these available times or select a different date for resche
             )
             
             if updated_booking:
-                # Convert new time to LA timezone for display
-                new_datetime_la = pytz.timezone('America/Los_Angeles').localize(new_datetime)
+                # new_datetime is already LA wall-clock time, which is all the display needs
                 return f"""
 **Meeting Rescheduled Successfully**
 
-**Original Time:** {original_start_la.strftime('%B %d, %Y at %I:%M %p')} (PT)
-**New Time:** {new_datetime_la.strftime('%B %d, %Y at %I:%M %p')} (PT)
+**Original Time:** {_fmt_datetime(original_start_la)} (PT)
+**New Time:** {_fmt_datetime(new_datetime)} (PT)
 
 **Meeting Details:**
 - **Title:** {updated_booking.title}
@@ -501,7 +429,7 @@ All attendees will be notified of the schedule change.
             return f"Error rescheduling booking: {str(e)}"
 
 
-class GetAvailableSlotsTool(BaseTool):
+class GetAvailableSlotsTool(CalendarBaseTool):
     """Tool for getting available time slots."""
     
     name: str = "get_available_slots"
@@ -512,67 +440,46 @@ class GetAvailableSlotsTool(BaseTool):
     """
     args_schema: type[BaseModel] = GetAvailableSlotsInput
     
-    def __init__(self, calcom_client: Optional[CalcomClient] = None):
-        super().__init__()
-        self.calcom_client = calcom_client or CalcomClient()
-    
     def _run(self, **kwargs) -> str:
         """Get available slots for the specified date(s)."""
         try:
-            input_data = GetAvailableSlotsInput(**kwargs)
+            # BaseTool.run has already validated kwargs against args_schema
+            input_data = GetAvailableSlotsInput.model_construct(**kwargs)
             
             # Use hardcoded event type ID
-            event_type_id = 3161359
-            
             # Use same date for end if not provided
             end_date = input_data.end_date if input_data.end_date else input_data.date
             
             # Get available slots from API
             available_slots = self.calcom_client.get_available_slots(
-                event_type_id=event_type_id,
+                event_type_id=EVENT_TYPE_ID,
                 start_date=input_data.date,
                 end_date=end_date
             )
             
-            if not available_slots:
-                if input_data.date == end_date:
-                    return f"No available slots found for {input_data.date}. Please try a different date."
-                else:
-                    return f"No available slots found between {input_data.date} and {end_date}. Please try different dates."
+            return _slots_reply(input_data.date, end_date, available_slots)
             
-            # Group slots by date and convert to LA timezone
-            slots_by_date = {}
-            for slot in available_slots:
-                try:
-                    slot_time_la = convert_utc_to_la(slot.time)
-                    slot_date = slot_time_la.strftime('%Y-%m-%d')
-                    slot_time_formatted = slot_time_la.strftime('%I:%M %p')
-                    
-                    if slot_date not in slots_by_date:
-                        slots_by_date[slot_date] = []
-                    slots_by_date[slot_date].append(slot_time_formatted)
-                except:
-                    continue
-            
-            if not slots_by_date:
-                return f"No valid time slots found. Please try a different date."
-            
-            # Format the response
-            if input_data.date == end_date:
-                result = f"**Available time slots for {input_data.date} (PT):**\n\n"
-            else:
-                result = f"**Available time slots from {input_data.date} to {end_date} (PT):**\n\n"
+        except Exception as e:
+            return f"Error getting available slots: {str(e)}"
+    
+    async def _arun(self, **kwargs) -> str:
+        """Get available slots without blocking the event loop."""
+        try:
+            # BaseTool.run has already validated kwargs against args_schema
+            input_data = GetAvailableSlotsInput.model_construct(**kwargs)
             
-            for slot_date in sorted(slots_by_date.keys()):
-                date_obj = datetime.strptime(slot_date, '%Y-%m-%d')
-                formatted_date = date_obj.strftime('%B %d, %Y')
-                times = ', '.join(sorted(slots_by_date[slot_date]))
-                result += f"**{formatted_date}:**\n{times}\n\n"
+            # Use hardcoded event type ID
+            # Use same date for end if not provided
+            end_date = input_data.end_date if input_data.end_date else input_data.date
             
-            result += "You can book any of these available times by saying something like:\n"
-            result += f'"Book a meeting on {input_data.date} at [time] with [attendee name] [attendee email]"'
+            # The slots API covers the whole range in a single request
+            available_slots = await self.calcom_client.aget_available_slots(
+                event_type_id=EVENT_TYPE_ID,
+                start_date=input_data.date,
+                end_date=end_date
+            )
             
-            return result.strip()
+            return _slots_reply(input_data.date, end_date, available_slots)
             
         except Exception as e:
             return f"Error getting available slots: {str(e)}"
@@ -587,12 +494,12 @@ def get_calendar_tools(calcom_client: Optional[CalcomClient] = None) -> List[Bas
     Returns:
         List of calendar tools
     """
-    client = calcom_client or CalcomClient()
+    client = calcom_client or get_client()
     
     return [
-        BookMeetingTool(client),
-        ListBookingsTool(client),
-        CancelBookingTool(client),
-        RescheduleBookingTool(client),
-        GetAvailableSlotsTool(client)
+        BookMeetingTool(calcom_client=client),
+        ListBookingsTool(calcom_client=client),
+        CancelBookingTool(calcom_client=client),
+        RescheduleBookingTool(calcom_client=client),
+        GetAvailableSlotsTool(calcom_client=client)
     ]
@@ -455,31 +455,39 @@ class SimpleChatInterface:
             for message in st.session_state.chat_history:
                 self.render_message(message)
         
-        # Typing indicator
-        if st.session_state.is_processing:
-            st.markdown("""
-            <div class="typing">
-                <div class="avatar">CB</div>
-                <div class="typing-content">
-                    <div class="typing-dots">
-                        <div class="typing-dot"></div>
-                        <div class="typing-dot"></div>
-                        <div class="typing-dot"></div>
-                    </div>
-                    <div class="typing-text">CalBolt is thinking...</div>
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
+        # Stream the reply to a pending user message below the history
+        if st.session_state.is_processing and st.session_state.chat_history:
+            last_message = st.session_state.chat_history[-1]
+            if last_message["role"] == "user":
+                self.process_response(last_message["content"])
+                # Rerun once the reply is complete to re-enable the input
+                st.rerun()
         
         st.markdown('</div>', unsafe_allow_html=True)
     
-    def render_message(self, message):
-        """Render a single message."""
+    def render_typing(self, placeholder):
+        """Render the typing indicator into a placeholder."""
+        placeholder.markdown("""
+        <div class="typing">
+            <div class="avatar">CB</div>
+            <div class="typing-content">
+                <div class="typing-dots">
+                    <div class="typing-dot"></div>
+                    <div class="typing-dot"></div>
+                    <div class="typing-dot"></div>
+                </div>
+                <div class="typing-text">CalBolt is thinking...</div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    def render_message(self, message, placeholder=None):
+        """Render a single message, optionally into an existing placeholder."""
         is_user = message["role"] == "user"
         role_class = "user" if is_user else "assistant"
         avatar_text = "U" if is_user else "CB"
         
-        st.markdown(f"""
+        (placeholder or st).markdown(f"""
         <br />
         <div class="message {role_class}">
             <div class="avatar">{avatar_text}</div>
@@ -571,21 +579,25 @@ class SimpleChatInterface:
             st.error(f"Error sending message: {str(e)}")
     
     def process_response(self, user_message):
-        """Process agent response."""
+        """Stream the agent response into the chat as it is generated."""
+        placeholder = st.empty()
+        self.render_typing(placeholder)
+        
         try:
             # Ensure we're in processing state
             if not st.session_state.is_processing:
                 st.session_state.is_processing = True
             
-            # Get response from agent
-            response = st.session_state.agent.chat(user_message)
-            
-            # Add agent response
+            # Replace the typing indicator with the reply as tokens arrive
             agent_message = {
                 "role": "assistant",
-                "content": response,
+                "content": "",
                 "timestamp": datetime.now().strftime("%H:%M")
             }
+            for chunk in st.session_state.agent.stream_chat(user_message):
+                agent_message["content"] += chunk
+                self.render_message(agent_message, placeholder)
+            
             st.session_state.chat_history.append(agent_message)
             
         except Exception as e:
@@ -651,13 +663,6 @@ class SimpleChatInterface:
             """)
             return
         
-        # Handle agent processing
-        if st.session_state.is_processing and st.session_state.chat_history:
-            last_message = st.session_state.chat_history[-1]
-            if last_message["role"] == "user":
-                self.process_response(last_message["content"])
-                st.rerun()
-        
         # Chat container
         st.markdown('<div class="chat-container">', unsafe_allow_html=True)
         
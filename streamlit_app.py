@@ -9,7 +9,9 @@ src_path = Path(__file__).parent / "src"
 sys.path.insert(0, str(src_path))
 
 # Import and run the Streamlit app
+from calbolt_chat_agent.config.settings import configure_logging
 from calbolt_chat_agent.ui.streamlit_app import main
 
 if __name__ == "__main__":
+    configure_logging()
     main()